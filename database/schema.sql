@@ -152,6 +152,17 @@ CREATE TABLE audit_logs (
   created_at TIMESTAMPTZ DEFAULT NOW()
 );
 
+-- ============================================================================
+-- PROCESSED STRIPE EVENTS TABLE (webhook deduplication)
+-- ============================================================================
+-- Stripe delivers webhooks at least once; the webhook endpoint inserts
+-- each event id here before dispatching and skips re-deliveries that
+-- hit the primary key.
+CREATE TABLE processed_events (
+  event_id TEXT PRIMARY KEY,
+  processed_at TIMESTAMPTZ DEFAULT NOW()
+);
+
 -- ============================================================================
 -- ROW LEVEL SECURITY (RLS) POLICIES
 -- ============================================================================
@@ -274,6 +285,19 @@ CREATE TRIGGER on_auth_user_created
   FOR EACH ROW
   EXECUTE FUNCTION public.handle_new_user();
 
+-- Function to mark a subscription canceled using the database clock
+-- (called from the Stripe webhook handler via PostgREST RPC, so
+-- canceled_at never depends on the app server's clock)
+CREATE OR REPLACE FUNCTION mark_subscription_canceled(sub_id TEXT)
+RETURNS VOID AS $$
+BEGIN
+  UPDATE subscriptions
+  SET status = 'canceled',
+      canceled_at = NOW()
+  WHERE stripe_subscription_id = sub_id;
+END;
+$$ LANGUAGE plpgsql SECURITY DEFINER;
+
 -- ============================================================================
 -- INDEXES FOR PERFORMANCE
 -- ============================================================================
@@ -292,6 +316,11 @@ CREATE INDEX idx_statements_created_at ON statements(created_at DESC);
 -- Subscriptions indexes
 CREATE INDEX idx_subscriptions_user_id ON subscriptions(user_id);
 CREATE INDEX idx_subscriptions_stripe_customer_id ON subscriptions(stripe_customer_id);
+-- Stripe webhooks (subscription.updated/deleted, invoice events) look
+-- rows up by stripe_subscription_id; partial index since the column is
+-- NULL until checkout completes
+CREATE INDEX idx_subscriptions_stripe_subscription_id ON subscriptions(stripe_subscription_id)
+  WHERE stripe_subscription_id IS NOT NULL;
 CREATE INDEX idx_subscriptions_status ON subscriptions(status);
 
 -- Audit logs indexes
@@ -18,7 +18,25 @@ class StatementParser:
         """
         self.file_path = Path(file_path)
         self.df = None
-        
+
+    def _read_csv(self, delimiter: str, **kwargs) -> pd.DataFrame:
+        """
+        Read the statement CSV, preferring pyarrow's multithreaded parser
+
+        Args:
+            delimiter: Detected field delimiter
+            **kwargs: Extra read_csv options (e.g. header=None)
+
+        Returns:
+            Parsed DataFrame
+        """
+        try:
+            return pd.read_csv(self.file_path, sep=delimiter, encoding='utf-8-sig',
+                               engine='pyarrow', **kwargs)
+        except (ImportError, ValueError):
+            # pyarrow not installed or option unsupported - use the C engine
+            return pd.read_csv(self.file_path, sep=delimiter, encoding='utf-8-sig', **kwargs)
+
     def load_statement(self, 
                       date_column: str = 'Date',
                       amount_column: str = 'Amount', 
@@ -50,7 +68,7 @@ class StatementParser:
                     delimiter = ','
             
             # Read CSV and detect if it has headers
-            self.df = pd.read_csv(self.file_path, sep=delimiter, encoding='utf-8-sig')
+            self.df = self._read_csv(delimiter)
             
             # Check if it looks like there are no headers
             first_col = str(self.df.columns[0])
@@ -63,7 +81,7 @@ class StatementParser:
             
             if not has_headers:
                 # Reload without headers and assign German column names
-                self.df = pd.read_csv(self.file_path, sep=delimiter, encoding='utf-8-sig', header=None)
+                self.df = self._read_csv(delimiter, header=None)
                 if len(self.df.columns) >= 3:
                     # Use the column names that will be passed to load_statement
                     self.df.columns = [date_column, description_column, amount_column] + [f'Col{i}' for i in range(3, len(self.df.columns))]
@@ -112,22 +130,19 @@ class StatementParser:
         
         # Convert amount to float (handle German number format: 1.234,56 -> 1234.56)
         # German format: thousands separator is "." and decimal separator is ","
-        # We need to remove thousands separator and replace decimal separator
-        def convert_german_number(amount_str):
-            amount_str = str(amount_str).strip()
-            # Remove currency symbols
-            amount_str = amount_str.replace('$', '').replace('€', '').strip()
-            # German format: replace thousand separator (.) with nothing, then decimal separator (,) with .
-            # But we need to be careful: "1.234,56" vs "-3,26"
-            if ',' in amount_str:
-                # Has comma - this is the decimal separator in German format
-                amount_str = amount_str.replace('.', '')  # Remove thousand separator
-                amount_str = amount_str.replace(',', '.')  # Replace decimal separator
-            # else: no comma, might be whole number or already in English format
-            return amount_str
-        
-        self.df['amount'] = self.df['amount'].apply(convert_german_number)
-        self.df['amount'] = pd.to_numeric(self.df['amount'], errors='coerce')
+        # Vectorized string ops replace the old per-row apply()
+        amount = (self.df['amount'].astype(str)
+                  .str.strip()
+                  .str.replace('$', '', regex=False)
+                  .str.replace('€', '', regex=False)
+                  .str.strip())
+        # Rows with a comma use German separators: drop the thousands "."
+        # then turn the decimal "," into "."; rows without a comma are left
+        # as-is ("1.234,56" vs "-3,26" vs "42")
+        has_comma = amount.str.contains(',', regex=False)
+        german = (amount.str.replace('.', '', regex=False)
+                  .str.replace(',', '.', regex=False))
+        self.df['amount'] = pd.to_numeric(german.where(has_comma, amount), errors='coerce')
         
         # Add match status column
         self.df['matched'] = False
@@ -175,7 +190,21 @@ class StatementParser:
         """
         self.df.loc[index, 'matched'] = True
         self.df.loc[index, 'matched_receipt'] = receipt_name
-    
+
+    def mark_matched_bulk(self, matches: Dict[int, str]):
+        """
+        Mark several transactions as matched in one vectorized assignment
+
+        Args:
+            matches: Mapping of DataFrame index -> matched receipt filename
+        """
+        if not matches:
+            return
+
+        indices = list(matches.keys())
+        self.df.loc[indices, 'matched'] = True
+        self.df.loc[indices, 'matched_receipt'] = list(matches.values())
+
     def export_results(self, output_path: str):
         """
         Export results to file
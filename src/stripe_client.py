@@ -2,18 +2,26 @@
 """Stripe client for subscription billing."""
 
 import os
-import stripe
 from typing import Dict, Any, Optional
 from dotenv import load_dotenv
 
 load_dotenv()
 
+# The stripe SDK is imported lazily in StripeClient.__init__ so that
+# importing this module (and the route modules that pull in the global
+# instance below) stays off the app's boot path
+stripe = None
+
 
 class StripeClient:
     """Wrapper for Stripe API operations."""
     
     def __init__(self):
         """Initialize Stripe client."""
+        global stripe
+        if stripe is None:
+            import stripe
+        
         secret_key = os.getenv('STRIPE_SECRET_KEY')
         
         if not secret_key:
@@ -203,4 +211,20 @@ class StripeClient:
 
 
 # Global instance
-stripe_client = StripeClient()
+class _LazyStripeClient:
+    """Builds the real client on first attribute access
+
+    Lets route modules import the global instance at module top without
+    paying the SDK import or requiring STRIPE_SECRET_KEY to be set
+    until Stripe is actually used.
+    """
+    _real = None
+    
+    def __getattr__(self, name):
+        if _LazyStripeClient._real is None:
+            _LazyStripeClient._real = StripeClient()
+        return getattr(_LazyStripeClient._real, name)
+
+
+# Global instance (constructed lazily on first use)
+stripe_client = _LazyStripeClient()
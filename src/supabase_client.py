@@ -3,17 +3,25 @@
 
 import os
 from typing import Optional, Dict, Any
-from supabase import create_client, Client
 from dotenv import load_dotenv
 
 # Load environment variables
 load_dotenv()
 
+# The supabase SDK is imported lazily in SupabaseClient.__init__ so that
+# importing this module (auth middleware and every route module does)
+# stays off the app's boot path
+create_client = None
+
 class SupabaseClient:
     """Wrapper for Supabase client with helper methods."""
     
     def __init__(self):
         """Initialize Supabase client."""
+        global create_client
+        if create_client is None:
+            from supabase import create_client
+        
         url = os.getenv('SUPABASE_URL')
         key = os.getenv('SUPABASE_ANON_KEY')
         
@@ -22,7 +30,7 @@ class SupabaseClient:
                 "SUPABASE_URL and SUPABASE_ANON_KEY must be set in environment variables"
             )
         
-        self.client: Client = create_client(url, key)
+        self.client = create_client(url, key)
         self.service_key = os.getenv('SUPABASE_SERVICE_KEY')
     
     # Authentication methods
@@ -111,6 +119,23 @@ class SupabaseClient:
                 "error": str(e)
             }
     
+    def upsert(self, table: str, data: Dict[str, Any],
+               on_conflict: Optional[str] = None) -> Dict[str, Any]:
+        """Insert data, merging into the existing row on conflict."""
+        try:
+            response = self.client.table(table).upsert(
+                data, on_conflict=on_conflict
+            ).execute()
+            return {
+                "success": True,
+                "data": response.data
+            }
+        except Exception as e:
+            return {
+                "success": False,
+                "error": str(e)
+            }
+    
     def select(self, table: str, filters: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
         """Select data from table."""
         try:
@@ -150,6 +175,20 @@ class SupabaseClient:
                 "error": str(e)
             }
     
+    def rpc(self, function: str, params: Dict[str, Any]) -> Dict[str, Any]:
+        """Call a Postgres function through PostgREST RPC."""
+        try:
+            response = self.client.rpc(function, params).execute()
+            return {
+                "success": True,
+                "data": response.data
+            }
+        except Exception as e:
+            return {
+                "success": False,
+                "error": str(e)
+            }
+    
     def delete(self, table: str, filters: Dict[str, Any]) -> Dict[str, Any]:
         """Delete data from table."""
         try:
@@ -170,5 +209,20 @@ class SupabaseClient:
             }
 
 
-# Global instance
-supabase_client = SupabaseClient()
+class _LazySupabaseClient:
+    """Builds the real client on first attribute access
+
+    Lets callers import the global instance at module top without
+    paying the SDK import or requiring the SUPABASE_* environment
+    variables until a query is actually issued.
+    """
+    _real = None
+    
+    def __getattr__(self, name):
+        if _LazySupabaseClient._real is None:
+            _LazySupabaseClient._real = SupabaseClient()
+        return getattr(_LazySupabaseClient._real, name)
+
+
+# Global instance (constructed lazily on first use)
+supabase_client = _LazySupabaseClient()
@@ -19,6 +19,42 @@ logger = setup_logger(__name__)
 # Store app start time
 APP_START_TIME = datetime.now()
 
+# Health check thresholds (percent used), hoisted so the per-request
+# health path only does constant comparisons
+DISK_CRITICAL_PERCENT = 95
+DISK_WARNING_PERCENT = 90
+MEMORY_WARNING_PERCENT = 90
+
+# TTL memo for syscall-backed probes (disk/memory) so polling dashboards
+# don't hit the OS on every request
+_PROBE_CACHE = {}
+_PROBE_TTL = 1.0  # seconds
+
+
+def _ttl_cache(func):
+    """
+    Cache a probe function's result for a short TTL
+
+    Args:
+        func: Function to cache (args must be hashable as strings)
+
+    Returns:
+        Wrapped function that skips the syscall within the TTL window
+    """
+    @wraps(func)
+    def wrapper(*args):
+        key = (func.__name__,) + tuple(str(a) for a in args)
+        now = time.monotonic()
+        cached = _PROBE_CACHE.get(key)
+        if cached is not None and cached[0] > now:
+            return cached[1]
+
+        value = func(*args)
+        _PROBE_CACHE[key] = (now + _PROBE_TTL, value)
+        return value
+
+    return wrapper
+
 
 def get_uptime() -> Dict:
     """
@@ -40,6 +76,7 @@ def get_uptime() -> Dict:
     }
 
 
+@_ttl_cache
 def get_disk_usage(path: Optional[Path] = None) -> Dict:
     """
     Get disk usage for a path
@@ -69,6 +106,7 @@ def get_disk_usage(path: Optional[Path] = None) -> Dict:
         return {'error': str(e)}
 
 
+@_ttl_cache
 def get_memory_usage() -> Dict:
     """
     Get current memory usage
@@ -106,24 +144,25 @@ def get_health_status() -> Dict:
         'checks': {}
     }
     
-    # Check disk space
+    # Check disk space (critical threshold first - it was unreachable
+    # behind the warning branch before)
     disk = get_disk_usage()
     if 'error' not in disk:
-        if disk['percent_used'] > 90:
-            health['status'] = 'degraded'
-            health['checks']['disk'] = 'warning - low disk space'
-        elif disk['percent_used'] > 95:
+        if disk['percent_used'] > DISK_CRITICAL_PERCENT:
             health['status'] = 'unhealthy'
             health['checks']['disk'] = 'critical - very low disk space'
+        elif disk['percent_used'] > DISK_WARNING_PERCENT:
+            health['status'] = 'degraded'
+            health['checks']['disk'] = 'warning - low disk space'
         else:
             health['checks']['disk'] = 'ok'
     else:
         health['checks']['disk'] = 'unknown'
-    
+
     # Check memory
     memory = get_memory_usage()
     if 'error' not in memory:
-        if memory['percent_used'] > 90:
+        if memory['percent_used'] > MEMORY_WARNING_PERCENT:
             health['status'] = 'degraded'
             health['checks']['memory'] = 'warning - high memory usage'
         else:
@@ -158,57 +197,75 @@ def monitor_performance(func):
     Returns:
         Wrapped function with performance logging
     """
+    # Slow-call threshold in integer nanoseconds
+    slow_ns = 5_000_000_000
+
     @wraps(func)
     def wrapper(*args, **kwargs):
-        start_time = time.time()
-        
+        # perf_counter_ns keeps the hot path in integer arithmetic -
+        # float conversion only happens when a log line is emitted
+        start_ns = time.perf_counter_ns()
+
         try:
             result = func(*args, **kwargs)
-            elapsed = time.time() - start_time
-            
-            logger.info(f"{func.__name__} completed in {elapsed:.2f}s")
-            
+            elapsed_ns = time.perf_counter_ns() - start_ns
+
+            logger.info(f"{func.__name__} completed in {elapsed_ns / 1e9:.2f}s")
+
             # Log warning if slow
-            if elapsed > 5.0:
-                logger.warning(f"{func.__name__} took {elapsed:.2f}s (slow)")
-            
+            if elapsed_ns > slow_ns:
+                logger.warning(f"{func.__name__} took {elapsed_ns / 1e9:.2f}s (slow)")
+
             return result
-            
+
         except Exception as e:
-            elapsed = time.time() - start_time
-            logger.error(f"{func.__name__} failed after {elapsed:.2f}s: {e}")
+            elapsed_ns = time.perf_counter_ns() - start_ns
+            logger.error(f"{func.__name__} failed after {elapsed_ns / 1e9:.2f}s: {e}")
             raise
-    
+
     return wrapper
 
 
 class PerformanceTracker:
     """Track performance metrics"""
-    
-    def __init__(self):
+
+    # Cap on distinct operation names so a long-running process with
+    # dynamically generated names can't grow the dict without bound
+    MAX_OPERATIONS = 1024
+
+    def __init__(self, max_operations: int = MAX_OPERATIONS):
         self.metrics = {}
-    
+        self.max_operations = max_operations
+
     def record(self, operation: str, duration: float):
         """
         Record an operation duration
-        
+
         Args:
             operation: Operation name
             duration: Duration in seconds
         """
-        if operation not in self.metrics:
+        # Maintain running aggregates in O(1) with a single dict lookup
+        stats = self.metrics.get(operation)
+        if stats is None:
+            if len(self.metrics) >= self.max_operations:
+                # LFU-style eviction: drop the least-recorded operation
+                evict = min(self.metrics, key=lambda op: self.metrics[op]['count'])
+                del self.metrics[evict]
             self.metrics[operation] = {
-                'count': 0,
-                'total_time': 0.0,
-                'min_time': float('inf'),
-                'max_time': 0.0
+                'count': 1,
+                'total_time': duration,
+                'min_time': duration,
+                'max_time': duration
             }
-        
-        stats = self.metrics[operation]
+            return
+
         stats['count'] += 1
         stats['total_time'] += duration
-        stats['min_time'] = min(stats['min_time'], duration)
-        stats['max_time'] = max(stats['max_time'], duration)
+        if duration < stats['min_time']:
+            stats['min_time'] = duration
+        if duration > stats['max_time']:
+            stats['max_time'] = duration
     
     def get_stats(self, operation: Optional[str] = None) -> Dict:
         """
@@ -221,20 +278,16 @@ class PerformanceTracker:
             Dictionary with statistics
         """
         if operation:
-            if operation in self.metrics:
-                stats = self.metrics[operation].copy()
-                stats['avg_time'] = stats['total_time'] / stats['count']
-                return {operation: stats}
-            return {}
-        
-        # All operations
-        result = {}
-        for op, stats in self.metrics.items():
-            op_stats = stats.copy()
-            op_stats['avg_time'] = stats['total_time'] / stats['count']
-            result[op] = op_stats
-        
-        return result
+            stats = self.metrics.get(operation)
+            if stats is None:
+                return {}
+            return {operation: {**stats, 'avg_time': stats['total_time'] / stats['count']}}
+
+        # All operations - avg is derived on read, never stored
+        return {
+            op: {**stats, 'avg_time': stats['total_time'] / stats['count']}
+            for op, stats in self.metrics.items()
+        }
 
 
 # Global performance tracker
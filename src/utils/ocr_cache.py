@@ -5,7 +5,7 @@ Caches extracted text from receipts to avoid expensive re-processing.
 """
 
 import hashlib
-import json
+import orjson
 from datetime import datetime
 from pathlib import Path
 from typing import Optional, Dict
@@ -44,10 +44,10 @@ class OCRCache:
         """
         if self.index_file.exists():
             try:
-                with open(self.index_file, 'r', encoding='utf-8') as f:
-                    index = json.load(f)
-                    logger.info(f"Loaded OCR cache index with {len(index)} entries")
-                    return index
+                # orjson parses the raw bytes directly - no UTF-8 decode pass
+                index = orjson.loads(self.index_file.read_bytes())
+                logger.info(f"Loaded OCR cache index with {len(index)} entries")
+                return index
             except Exception as e:
                 logger.error(f"Failed to load cache index: {e}")
         
@@ -59,8 +59,9 @@ class OCRCache:
             return
         
         try:
-            with open(self.index_file, 'w', encoding='utf-8') as f:
-                json.dump(self.index, f, indent=2)
+            self.index_file.write_bytes(
+                orjson.dumps(self.index, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS)
+            )
             logger.debug(f"Saved cache index with {len(self.index)} entries")
         except Exception as e:
             logger.error(f"Failed to save cache index: {e}")
@@ -105,9 +106,8 @@ class OCRCache:
                 cache_file = self.cache_dir / f"{file_hash}.json"
                 
                 if cache_file.exists():
-                    with open(cache_file, 'r', encoding='utf-8') as f:
-                        cached_data = json.load(f)
-                    
+                    cached_data = orjson.loads(cache_file.read_bytes())
+
                     logger.debug(f"Cache hit for {file_path.name}")
                     
                     # Update last accessed time
@@ -145,15 +145,19 @@ class OCRCache:
             cache_file = self.cache_dir / f"{file_hash}.json"
             
             # Save OCR data
-            with open(cache_file, 'w', encoding='utf-8') as f:
-                json.dump(ocr_data, f, indent=2, ensure_ascii=False, default=str)
+            cache_file.write_bytes(
+                orjson.dumps(ocr_data,
+                             option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS,
+                             default=str)
+            )
             
-            # Update index
+            # Update index (single timestamp per operation)
+            now = datetime.now().isoformat()
             self.index[file_hash] = {
                 'filename': file_path.name,
                 'file_size': file_path.stat().st_size,
-                'cached_at': datetime.now().isoformat(),
-                'last_accessed': datetime.now().isoformat(),
+                'cached_at': now,
+                'last_accessed': now,
                 'access_count': 0
             }
             self._save_index()
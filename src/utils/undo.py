@@ -4,7 +4,7 @@ Persistent Undo History System
 Manages undo/redo operations with persistent storage.
 """
 
-import json
+import orjson
 from collections import deque
 from datetime import datetime
 from pathlib import Path
@@ -47,10 +47,10 @@ class UndoManager:
         
         if file_path.exists():
             try:
-                with open(file_path, 'r', encoding='utf-8') as f:
-                    data = json.load(f)
-                    logger.info(f"Loaded {len(data)} items from {file_path.name}")
-                    return deque(data, maxlen=Config.UNDO_HISTORY_SIZE)
+                # orjson parses the raw bytes directly - no UTF-8 decode pass
+                data = orjson.loads(file_path.read_bytes())
+                logger.info(f"Loaded {len(data)} items from {file_path.name}")
+                return deque(data, maxlen=Config.UNDO_HISTORY_SIZE)
             except Exception as e:
                 logger.error(f"Failed to load history from {file_path}: {e}")
         
@@ -68,8 +68,9 @@ class UndoManager:
             return
         
         try:
-            with open(file_path, 'w', encoding='utf-8') as f:
-                json.dump(list(history), f, indent=2, ensure_ascii=False)
+            file_path.write_bytes(
+                orjson.dumps(list(history), option=orjson.OPT_INDENT_2)
+            )
             logger.debug(f"Saved {len(history)} items to {file_path.name}")
         except Exception as e:
             logger.error(f"Failed to save history to {file_path}: {e}")
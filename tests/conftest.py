@@ -7,13 +7,12 @@ Provides reusable test fixtures for the test suite.
 import pytest
 from pathlib import Path
 from datetime import datetime
-import pandas as pd
 import tempfile
 import shutil
 
-from src.matcher import ReceiptMatcher
-from src.statement_parser import StatementParser
-from src.receipt_processor import ReceiptProcessor
+# Heavy imports (pandas, pytesseract via ReceiptProcessor, fuzzywuzzy via
+# ReceiptMatcher) are done lazily inside the fixtures that need them, so
+# running a subset like tests/test_security.py doesn't pay for them.
 
 
 @pytest.fixture
@@ -25,9 +24,13 @@ def temp_dir():
     shutil.rmtree(temp_path)
 
 
-@pytest.fixture
-def sample_statement_csv(temp_dir):
-    """Create a sample German bank statement CSV"""
+@pytest.fixture(scope='session')
+def sample_statement_csv(tmp_path_factory):
+    """Create a sample German bank statement CSV (once per session)
+
+    Tests only read this file, so writing it once avoids re-creating
+    and re-parsing it for every test that uses the parser.
+    """
     csv_content = """Buchungstag;Betrag;Verwendungszweck
 10.01.2026;-44,84;REWE SAGT DANKE/Berlin
 15.01.2026;-25,00;Netflix Subscription
@@ -35,7 +38,7 @@ def sample_statement_csv(temp_dir):
 25.01.2026;-18,50;Amazon.de Order 123
 30.01.2026;-3,26;Mehrwertsteuer"""
     
-    csv_file = temp_dir / "test_statement.csv"
+    csv_file = tmp_path_factory.mktemp("statements") / "test_statement.csv"
     csv_file.write_text(csv_content, encoding='utf-8-sig')
     
     return csv_file
@@ -97,10 +100,12 @@ def sample_receipts():
 @pytest.fixture
 def receipt_matcher():
     """Create a ReceiptMatcher instance"""
+    from src.matcher import ReceiptMatcher
     return ReceiptMatcher()
 
 
 @pytest.fixture
 def statement_parser(sample_statement_csv):
     """Create a StatementParser instance with sample data"""
+    from src.statement_parser import StatementParser
     return StatementParser(str(sample_statement_csv))
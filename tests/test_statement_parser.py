@@ -110,6 +110,23 @@ class TestMatchMarking:
         # Others should be unmatched
         assert statement_parser.df.loc[1, 'matched'] == False
 
+    def test_mark_matched_bulk(self, statement_parser):
+        """Test marking several transactions as matched at once"""
+        statement_parser.load_statement(
+            date_column='Buchungstag',
+            amount_column='Betrag',
+            description_column='Verwendungszweck'
+        )
+
+        statement_parser.mark_matched_bulk({0: 'receipt1.pdf', 2: 'receipt3.pdf'})
+
+        assert statement_parser.df.loc[0, 'matched'] == True
+        assert statement_parser.df.loc[0, 'matched_receipt'] == 'receipt1.pdf'
+        assert statement_parser.df.loc[2, 'matched_receipt'] == 'receipt3.pdf'
+
+        # Untouched rows stay unmatched
+        assert statement_parser.df.loc[1, 'matched'] == False
+
 
 class TestExport:
     """Test exporting results"""
@@ -9,67 +9,112 @@ Displays a clean table showing:
 - Receipt matched (True/False)
 """
 
+import numpy as np
 import pandas as pd
 from pathlib import Path
 from rich.console import Console
 from rich.table import Table
 from rich.panel import Panel
-from rich.live import Live
-from rich.layout import Layout
 import sys
 
-console = Console()
+# Single shared console for the whole run; skip color escape generation
+# entirely when output is piped (tests, cron, shell redirects)
+console = Console(no_color=not sys.stdout.isatty())
 
 # Configuration
 STATEMENT_FILE = "data/statements/Umsatzanzeige Jan 31 2026.csv"
 OUTPUT_CSV = "output/statement_with_matches.csv"
 
+# Columns the viewer actually renders
+VIEW_COLUMNS = ('Buchungstag', 'Betrag', 'Verwendungszweck',
+                'Matching Receipt Found', 'Matched Receipt File', 'Match Confidence')
+
+
+def _read_statement_csv(path):
+    """Read a statement CSV, only materializing the columns the viewer uses"""
+    try:
+        # pyarrow's multithreaded parser tokenizes much faster than the C engine
+        df = pd.read_csv(path, sep=';', encoding='utf-8-sig', engine='pyarrow')
+        return df[[c for c in VIEW_COLUMNS if c in df.columns]]
+    except (ImportError, ValueError):
+        # Fall back to the C engine; prune columns at parse time
+        return pd.read_csv(path, sep=';', encoding='utf-8-sig',
+                           usecols=lambda c: c in VIEW_COLUMNS)
+
 
 def load_data():
     """Load the statement with match status"""
     # Try to load updated CSV first, otherwise use original
     if Path(OUTPUT_CSV).exists():
-        df = pd.read_csv(OUTPUT_CSV, sep=';', encoding='utf-8-sig')
+        df = _read_statement_csv(OUTPUT_CSV)
         source = OUTPUT_CSV
     else:
-        df = pd.read_csv(STATEMENT_FILE, sep=';', encoding='utf-8-sig')
+        df = _read_statement_csv(STATEMENT_FILE)
         # Add match columns if they don't exist
         if 'Matching Receipt Found' not in df.columns:
             df['Matching Receipt Found'] = False
             df['Matched Receipt File'] = ''
             df['Match Confidence'] = 0
         source = STATEMENT_FILE
-    
+
+    # Normalize the match column to real bools once, so downstream
+    # reductions are a single numpy pass instead of object-dtype sums
+    if 'Matching Receipt Found' in df.columns:
+        df['Matching Receipt Found'] = df['Matching Receipt Found'].fillna(False).astype(bool)
+
     return df, source
 
 
-def create_summary_stats(df):
+# Memo for summary stats keyed on the source file's (path, mtime) - a
+# refresh loop re-rendering an unchanged file skips the reductions, and
+# a rewritten file bumps the mtime and misses. One entry per source.
+_summary_cache = {}
+
+
+def create_summary_stats(df, source=None):
     """Create summary statistics"""
+    cache_key = None
+    if source is not None:
+        try:
+            cache_key = (source, Path(source).stat().st_mtime_ns)
+        except OSError:
+            pass
+    if cache_key is not None:
+        cached = _summary_cache.get(source)
+        if cached is not None and cached[0] == cache_key:
+            return cached[1]
+
     total = len(df)
-    matched = df['Matching Receipt Found'].sum() if 'Matching Receipt Found' in df.columns else 0
+    if 'Matching Receipt Found' in df.columns:
+        matched = int(np.count_nonzero(df['Matching Receipt Found'].to_numpy()))
+    else:
+        matched = 0
     unmatched = total - matched
     match_rate = (matched / total * 100) if total > 0 else 0
     
-    return {
+    stats = {
         'total': total,
         'matched': matched,
         'unmatched': unmatched,
         'match_rate': match_rate
     }
+    if cache_key is not None:
+        _summary_cache[source] = (cache_key, stats)
+    return stats
 
 
 def create_progress_table(df, show_all=True, show_matched_only=False, show_unmatched_only=False):
     """Create the progress table"""
     
-    # Filter based on options
+    # Filter based on options - views are read-only here, so no copies
     if show_matched_only:
-        display_df = df[df['Matching Receipt Found'] == True].copy()
+        display_df = df[df['Matching Receipt Found'] == True]
         title = "Matched Transactions"
     elif show_unmatched_only:
-        display_df = df[df['Matching Receipt Found'] == False].copy()
+        display_df = df[df['Matching Receipt Found'] == False]
         title = "Unmatched Transactions"
     else:
-        display_df = df.copy()
+        display_df = df
         title = "All Transactions"
     
     table = Table(title=title, show_header=True, header_style="bold magenta")
@@ -82,40 +127,66 @@ def create_progress_table(df, show_all=True, show_matched_only=False, show_unmat
     table.add_column("Matched", style="bold", width=10)
     table.add_column("Receipt", style="dim", width=30)
     
-    # Add rows
-    for idx, row in display_df.iterrows():
-        row_num = idx + 2  # +2 for header and 0-index
-        
-        # Format date
-        date_str = row['Buchungstag'] if pd.notna(row['Buchungstag']) else 'N/A'
-        
-        # Format amount
-        amount_str = f"€{row['Betrag']}" if pd.notna(row['Betrag']) else 'N/A'
-        
-        # Get merchant/description
-        description = str(row['Verwendungszweck'])[:50] if pd.notna(row['Verwendungszweck']) else 'N/A'
-        
-        # Match status
-        is_matched = row['Matching Receipt Found'] if 'Matching Receipt Found' in row else False
-        matched_str = "[green]✓ Yes[/green]" if is_matched else "[red]✗ No[/red]"
-        
-        # Receipt file
-        receipt = row['Matched Receipt File'][:30] if pd.notna(row.get('Matched Receipt File', '')) and row.get('Matched Receipt File', '') else '-'
-        
-        table.add_row(
-            str(row_num),
-            date_str,
-            amount_str,
-            description,
-            matched_str,
-            receipt
-        )
-    
+    # Format all columns vectorized, then add rows from plain lists
+    # (avoids the per-row Series boxing that iterrows() does)
+    if len(display_df) > 0:
+        dates = display_df['Buchungstag'].fillna('N/A').astype(str).tolist()
+        amounts = ('€' + display_df['Betrag'].astype(str)).where(
+            display_df['Betrag'].notna(), 'N/A').tolist()
+        descriptions = display_df['Verwendungszweck'].fillna('N/A').astype(str).str.slice(0, 50).tolist()
+
+        if 'Matching Receipt Found' in display_df.columns:
+            matched = display_df['Matching Receipt Found'].fillna(False).astype(bool).tolist()
+        else:
+            matched = [False] * len(display_df)
+
+        if 'Matched Receipt File' in display_df.columns:
+            receipts = (display_df['Matched Receipt File'].fillna('').astype(str)
+                        .str.slice(0, 30).replace({'': '-', 'nan': '-'}).tolist())
+        else:
+            receipts = ['-'] * len(display_df)
+
+        # +2 for header and 0-index, computed once as a numpy array
+        # instead of per-row Python int arithmetic
+        row_nums = (display_df.index.to_numpy() + 2).astype(str).tolist()
+
+        # Bind add_row once - Table has no bulk-row constructor, so this
+        # avoids the attribute lookup on every row of a large statement
+        add_row = table.add_row
+        for row_num, date_str, amount_str, description, is_matched, receipt in zip(
+                row_nums, dates, amounts, descriptions, matched, receipts):
+            matched_str = "[green]✓ Yes[/green]" if is_matched else "[red]✗ No[/red]"
+
+            add_row(
+                row_num,
+                date_str,
+                amount_str,
+                description,
+                matched_str,
+                receipt
+            )
+
     return table
 
 
+def parse_args(argv=None):
+    """Parse command line options once"""
+    import argparse
+
+    parser = argparse.ArgumentParser(
+        description='Show receipt matching progress for the current statement')
+    group = parser.add_mutually_exclusive_group()
+    group.add_argument('-m', '--matched', action='store_true',
+                       help='show only matched transactions')
+    group.add_argument('-u', '--unmatched', action='store_true',
+                       help='show only unmatched transactions')
+    return parser.parse_args(argv)
+
+
 def main():
     """Main viewer"""
+    args = parse_args()
+
     console.print("\n[bold blue]Receipt Matching Progress Viewer[/bold blue]\n")
     
     # Load data
@@ -123,7 +194,7 @@ def main():
     console.print(f"[dim]Loaded from: {source}[/dim]\n")
     
     # Show summary
-    stats = create_summary_stats(df)
+    stats = create_summary_stats(df, source)
     
     summary_table = Table(show_header=True, header_style="bold cyan")
     summary_table.add_column("Metric", style="cyan")
@@ -137,27 +208,16 @@ def main():
     console.print(Panel(summary_table, title="Summary", border_style="blue"))
     console.print()
     
-    # Check command line arguments
-    show_matched = '--matched' in sys.argv or '-m' in sys.argv
-    show_unmatched = '--unmatched' in sys.argv or '-u' in sys.argv
-    
     # Show progress table
     table = create_progress_table(
-        df, 
-        show_all=not (show_matched or show_unmatched),
-        show_matched_only=show_matched,
-        show_unmatched_only=show_unmatched
+        df,
+        show_all=not (args.matched or args.unmatched),
+        show_matched_only=args.matched,
+        show_unmatched_only=args.unmatched
     )
-    
+
     console.print(table)
     console.print()
-    
-    # Show help
-    console.print("[dim]Options:[/dim]")
-    console.print("[dim]  python view_progress.py          - Show all transactions[/dim]")
-    console.print("[dim]  python view_progress.py --matched   - Show only matched[/dim]")
-    console.print("[dim]  python view_progress.py --unmatched - Show only unmatched[/dim]")
-    console.print()
 
 
 if __name__ == '__main__':
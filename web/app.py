@@ -8,14 +8,30 @@ Flask web application for managing receipt matching
 from flask import Flask, render_template, jsonify, request, send_file
 from flask_cors import CORS
 from werkzeug.utils import secure_filename
+import numpy as np
 import pandas as pd
+import functools
 import sys
 import os
 from pathlib import Path
+from stat import S_ISREG
 from datetime import datetime
+import re
 import shutil
+import threading
 from collections import deque
+from concurrent.futures import ThreadPoolExecutor, wait
 import json
+import platform
+import random
+import string
+import subprocess
+import traceback
+
+try:
+    import orjson
+except ImportError:  # optional - stdlib jsonify fallback below
+    orjson = None
 
 # Add parent directory to path FIRST
 sys.path.insert(0, str(Path(__file__).parent.parent))
@@ -24,13 +40,24 @@ from src.utils.logging import setup_logger
 
 logger = setup_logger(__name__)
 
-from src.receipt_processor import ReceiptProcessor
-from src.statement_parser import StatementParser
+from src.utils.security import SecurityError, validate_path_traversal
 
 app = Flask(__name__)
 CORS(app)
 
-# Undo history - store last 50 operations per statement
+# Behind nginx/Apache, let the front-end server stream PDFs via
+# sendfile(2) instead of the Python worker: send_file then only emits an
+# X-Sendfile header. Off by default so dev mode keeps working.
+app.config['USE_X_SENDFILE'] = os.environ.get('USE_X_SENDFILE', '').lower() in ('1', 'true', 'yes')
+
+# File-manager launcher for /api/open-folder, resolved once:
+# platform.system() never changes within a process
+_OPEN_FOLDER_CMD = {'Darwin': 'open', 'Windows': 'explorer'}.get(
+    platform.system(), 'xdg-open')
+
+# Undo history - store last 50 operations per statement. The deques are
+# a per-process cache; each statement's history is also persisted to an
+# append-only JSONL log so it survives restarts (see _get_undo_history)
 undo_history = {}  # {statement_name: deque([{operation_data}, ...], maxlen=50)}
 
 # Configuration
@@ -40,10 +67,20 @@ STATEMENTS_BASE_FOLDER = BASE_DIR / "statements"
 # Create base folder
 STATEMENTS_BASE_FOLDER.mkdir(parents=True, exist_ok=True)
 
+# Merchant-name sanitizers for generated receipt filenames, compiled
+# once instead of per receipt
+_FN_SANITIZE = re.compile(r'[^\w\s-]')
+_FN_WS = re.compile(r'\s+')
+
 # Allowed file extensions
 ALLOWED_STATEMENT_EXTENSIONS = {'csv', 'xlsx', 'xls'}
 ALLOWED_RECEIPT_EXTENSIONS = {'pdf'}
 
+# Dotted-suffix tuples for str.endswith: one C call per filename instead
+# of a split + lowered-fragment set lookup
+_ALLOWED_STMT_SUFFIXES = tuple(sorted('.' + e for e in ALLOWED_STATEMENT_EXTENSIONS))
+_ALLOWED_RCPT_SUFFIXES = tuple(sorted('.' + e for e in ALLOWED_RECEIPT_EXTENSIONS))
+
 
 def get_statement_folder(statement_name):
     """Get the folder path for a specific statement"""
@@ -62,11 +99,14 @@ def create_statement_folders(statement_name):
     statement_folder = get_statement_folder(statement_name)
     receipts_folder = statement_folder / 'receipts'
     matched_folder = statement_folder / 'matched_receipts'
-    
-    statement_folder.mkdir(parents=True, exist_ok=True)
-    receipts_folder.mkdir(parents=True, exist_ok=True)
-    matched_folder.mkdir(parents=True, exist_ok=True)
-    
+
+    # Two leaf makedirs create the base implicitly; the isdir fast path
+    # skips the mkdir->EEXIST round trip on every later upload
+    if not os.path.isdir(receipts_folder):
+        os.makedirs(receipts_folder, exist_ok=True)
+    if not os.path.isdir(matched_folder):
+        os.makedirs(matched_folder, exist_ok=True)
+
     return {
         'base': statement_folder,
         'receipts': receipts_folder,
@@ -74,41 +114,432 @@ def create_statement_folders(statement_name):
     }
 
 
-def allowed_file(filename, allowed_extensions):
+def allowed_file(filename, allowed_suffixes):
     """Check if file extension is allowed"""
-    return '.' in filename and filename.rsplit('.', 1)[1].lower() in allowed_extensions
+    return filename.lower().endswith(allowed_suffixes)
+
+
+# Shared pool for blocking disk I/O so a multi-MB write doesn't pin the
+# request thread longer than it has to
+_io_executor = ThreadPoolExecutor(max_workers=4, thread_name_prefix='disk-io')
+
+
+# Memoized statement listing, keyed on the per-folder mtimes so repeated
+# /api/statements polls skip the inner directory scans entirely
+_statements_cache = {'key': None, 'value': None}
+_statements_lock = threading.Lock()
 
 
 def get_all_statements():
     """Get list of all statement folders"""
+    # One scandir pass over the base folder gives the cache key; DirEntry
+    # carries is_dir() and stat() without re-opening the directory
+    try:
+        with os.scandir(STATEMENTS_BASE_FOLDER) as it:
+            folders = sorted((e for e in it if e.is_dir()), key=lambda e: e.name)
+    except OSError:
+        return []
+
+    cache_key = tuple((e.name, e.stat().st_mtime_ns) for e in folders)
+
+    with _statements_lock:
+        if _statements_cache['key'] == cache_key:
+            return _statements_cache['value']
+
     statements = []
-    
-    # Look for statement CSV files in subfolders
-    for folder in STATEMENTS_BASE_FOLDER.iterdir():
-        if folder.is_dir():
-            # Look for CSV/Excel files in the folder
-            for ext in ALLOWED_STATEMENT_EXTENSIONS:
-                statement_files = list(folder.glob(f"*.{ext}"))
-                for s in statement_files:
-                    # Skip files ending with _matches.csv or _matches.xlsx or _backup
-                    if s.stem.endswith('_matches') or '_backup' in s.stem:
-                        continue
-                    
-                    statements.append({
-                        'name': s.name,
-                        'folder': folder.name,
-                        'path': str(s.relative_to(BASE_DIR)),
-                        'modified': datetime.fromtimestamp(s.stat().st_mtime).isoformat(),
-                        'receipts_folder': str((folder / 'receipts').relative_to(BASE_DIR)),
-                        'matched_folder': str((folder / 'matched_receipts').relative_to(BASE_DIR))
-                    })
-    
+
+    # BASE_DIR-relative prefix computed once; the per-entry paths are
+    # then plain string formatting instead of Path arithmetic
+    base_rel = STATEMENTS_BASE_FOLDER.relative_to(BASE_DIR).as_posix()
+
+    # Look for statement CSV/Excel files in subfolders
+    for folder_entry in folders:
+        folder_rel = f"{base_rel}/{folder_entry.name}"
+        with os.scandir(folder_entry.path) as it:
+            for entry in it:
+                if not entry.is_file():
+                    continue
+
+                stem, dot, ext = entry.name.rpartition('.')
+                if not dot or ext.lower() not in ALLOWED_STATEMENT_EXTENSIONS:
+                    continue
+
+                # Skip files ending with _matches.csv or _matches.xlsx or _backup
+                if stem.endswith('_matches') or '_backup' in stem:
+                    continue
+
+                statements.append({
+                    'name': entry.name,
+                    'folder': folder_entry.name,
+                    'path': f"{folder_rel}/{entry.name}",
+                    'modified': _iso_mtime(entry.stat().st_mtime),
+                    'receipts_folder': f"{folder_rel}/receipts",
+                    'matched_folder': f"{folder_rel}/matched_receipts"
+                })
+
     # Sort by name
     statements.sort(key=lambda x: x['name'])
-    
+
+    with _statements_lock:
+        _statements_cache['key'] = cache_key
+        _statements_cache['value'] = statements
+
     return statements
 
 
+@functools.lru_cache(maxsize=65536)
+def _iso_mtime(mtime):
+    """ISO timestamp for a file mtime, memoized per value
+
+    Directory listings format thousands of unchanged mtimes on every
+    poll; caching skips the datetime allocation and strftime for all of
+    them.
+    """
+    return datetime.fromtimestamp(mtime).isoformat()
+
+
+def _matches_feather(output_csv):
+    """Feather sidecar path for a matches CSV"""
+    return output_csv.with_suffix('.feather')
+
+
+def _save_matches(df, output_csv):
+    """Persist the matches table (canonical CSV plus feather sidecar)
+
+    The CSV stays canonical so it remains downloadable and openable in a
+    spreadsheet; the feather sidecar is what the hot read path prefers,
+    since loading it skips CSV tokenizing entirely and keeps dtypes.
+    """
+    # Every caller's frame came through load_statement_data, which has
+    # already merged any pending single-cell overrides, so a full save
+    # flushes them implicitly - just retire the sidecar. Re-applying it
+    # here would let stale entries clobber the caller's in-request edits.
+    output_csv.parent.mkdir(parents=True, exist_ok=True)
+    df.to_csv(output_csv, sep=';', index=False, encoding='utf-8-sig')
+
+    try:
+        _overrides_path(output_csv).unlink()
+    except OSError:
+        pass
+
+    # The sidecar is a derived artifact, so its write can leave the
+    # request thread; a read racing it just falls back to the fresh CSV
+    _io_executor.submit(_write_feather_sidecar,
+                        df.reset_index(drop=True), _matches_feather(output_csv))
+
+
+def _fast_move(src, dst):
+    """Move a file, preferring a single-syscall rename
+
+    Receipt moves stay inside one statement folder (same filesystem),
+    where os.replace is one atomic rename; shutil.move's stat-and-copy
+    path only runs if a move ever crosses devices.
+    """
+    try:
+        os.replace(src, dst)
+    except OSError:
+        shutil.move(str(src), str(dst))
+
+
+def _save_upload(file, filepath):
+    """Copy an uploaded part to disk in 1 MiB blocks
+
+    werkzeug's FileStorage.save copies in 16 KiB chunks; multi-MB PDFs
+    move noticeably faster with fewer, larger write() syscalls.
+    """
+    with open(filepath, 'wb') as f:
+        shutil.copyfileobj(file.stream, f, length=1 << 20)
+
+
+def _write_feather_sidecar(frame, feather_path):
+    """Write the feather sidecar, tolerating pyarrow being absent
+
+    Writes to a temp file and os.replace's it into place so a reader
+    racing this background write never sees a half-written sidecar.
+    """
+    tmp_path = feather_path.with_suffix('.feather.tmp')
+    try:
+        frame.to_feather(tmp_path)
+        os.replace(tmp_path, feather_path)
+    except Exception as e:
+        # pyarrow missing or an unserializable frame - CSV alone is still correct
+        logger.debug(f"Feather sidecar write skipped for {feather_path.name}: {e}")
+
+
+def _overrides_path(output_csv):
+    """Sidecar JSON path holding pending single-cell edits"""
+    return output_csv.with_name(output_csv.stem.replace('_matches', '') + '_overrides.json')
+
+
+# Flag columns a single click may override without a full CSV rewrite,
+# keyed by their JSON names in the sidecar
+_OVERRIDE_COLUMNS = {'no_receipt_needed': 'No Receipt Needed',
+                     'owner_mark': 'Owner_Mark',
+                     'owner_flo': 'Owner_Flo'}
+
+
+def _load_overrides(overrides_path):
+    """Load pending flag overrides as {df_index: {json_key: bool}}"""
+    try:
+        with open(overrides_path, 'r', encoding='utf-8') as f:
+            raw = json.load(f)
+    except FileNotFoundError:
+        return {}
+    except Exception as e:
+        logger.warning(f"Overrides file unreadable, ignoring {overrides_path.name}: {e}")
+        return {}
+
+    return {int(idx): {key: bool(value) for key, value in entry.items()
+                       if key in _OVERRIDE_COLUMNS}
+            for idx, entry in raw.items()}
+
+
+def _save_overrides(overrides_path, overrides):
+    """Atomically persist overrides (write temp file, then os.replace)"""
+    payload = {str(idx): entry for idx, entry in overrides.items()}
+    tmp_path = overrides_path.with_suffix('.json.tmp')
+    with open(tmp_path, 'w', encoding='utf-8') as f:
+        json.dump(payload, f)
+    os.replace(tmp_path, overrides_path)
+
+
+def _apply_overrides(df, overrides):
+    """Merge pending overrides into a loaded frame (vectorized, in place)
+
+    Out-of-range indices are dropped rather than applied - .loc with an
+    unknown label would append a new row.
+    """
+    n = len(df)
+    for key, column in _OVERRIDE_COLUMNS.items():
+        checked = [idx for idx, entry in overrides.items()
+                   if entry.get(key) is True and 0 <= idx < n]
+        unchecked = [idx for idx, entry in overrides.items()
+                     if entry.get(key) is False and 0 <= idx < n]
+        if not checked and not unchecked:
+            continue
+        if column not in df.columns:
+            df[column] = False
+        if checked:
+            df.loc[checked, column] = True
+        if unchecked:
+            df.loc[unchecked, column] = False
+    return df
+
+
+def _undo_path(statement_name):
+    """Append-only JSONL log backing a statement's undo history"""
+    return get_statement_folder(statement_name) / 'undo.log.jsonl'
+
+
+def _get_undo_history(statement_name):
+    """In-memory undo deque, rebuilt from the tail of the log on first use"""
+    history = undo_history.get(statement_name)
+    if history is None:
+        history = deque(maxlen=50)
+        try:
+            with open(_undo_path(statement_name), 'r', encoding='utf-8') as f:
+                # deque over the file keeps only the last 50 lines in memory
+                for line in deque(f, maxlen=50):
+                    try:
+                        history.append(json.loads(line))
+                    except ValueError:
+                        continue
+        except OSError:
+            pass
+        undo_history[statement_name] = history
+    return history
+
+
+def _append_undo(statement_name, action):
+    """Record an action in memory and append it to the persistent log"""
+    history = _get_undo_history(statement_name)
+    history.append(action)
+    try:
+        with open(_undo_path(statement_name), 'a', encoding='utf-8') as f:
+            f.write(json.dumps(action) + '\n')
+    except OSError as e:
+        logger.warning(f"Undo log append failed for {statement_name}: {e}")
+    return history
+
+
+def _rewrite_undo_log(statement_name, history):
+    """Rewrite the undo log after a pop (at most 50 small lines)"""
+    log_path = _undo_path(statement_name)
+    tmp_path = log_path.with_suffix('.jsonl.tmp')
+    try:
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            f.writelines(json.dumps(action) + '\n' for action in history)
+        os.replace(tmp_path, log_path)
+    except OSError as e:
+        logger.warning(f"Undo log rewrite failed for {statement_name}: {e}")
+
+
+# Checkbox-style columns coerced to real bool dtype at load time
+_FLAG_COLUMNS = ('Matching Receipt Found', 'No Receipt Needed',
+                 'Manually_Unmatched', 'Owner_Mark', 'Owner_Flo')
+
+# Dtype hints for the text columns we always treat as strings - skips
+# inference work and stops receipt names like '001' becoming integers.
+# Columns absent from a given file are simply ignored by read_csv.
+# usecols pruning is deliberately NOT applied: saves round-trip the full
+# frame back to disk, so dropping columns at load would lose them.
+_MATCHES_DTYPES = {
+    'Buchungstag': str,
+    'Verwendungszweck': str,
+    'Betrag': str,
+    'Matched Receipt File': str,
+}
+
+
+def _read_matches_csv(path_str):
+    """Read a matches CSV with dtype hints, preferring the pyarrow engine
+
+    pyarrow's multithreaded tokenizer parses wide bank exports
+    considerably faster than the C engine; fall back when it is not
+    installed or rejects an option.
+    """
+    kwargs = dict(sep=';', encoding='utf-8-sig', dtype=_MATCHES_DTYPES)
+    try:
+        return pd.read_csv(path_str, engine='pyarrow', **kwargs)
+    except (ImportError, ValueError):
+        # memory_map only applies to the C engine: the parser then reads
+        # straight from page cache instead of copying through stdio
+        return pd.read_csv(path_str, memory_map=True, low_memory=False,
+                           **kwargs)
+
+
+def _ensure_columns(df):
+    """Add the match status columns when a frame doesn't carry them yet"""
+    if 'Matching Receipt Found' not in df.columns:
+        df['Matching Receipt Found'] = False
+        df['Matched Receipt File'] = ''
+        df['Match Confidence'] = 0
+    if 'No Receipt Needed' not in df.columns:
+        df['No Receipt Needed'] = False
+    if 'Manually_Unmatched' not in df.columns:
+        df['Manually_Unmatched'] = False
+    return df
+
+
+def _coerce_flag_columns(df):
+    """Coerce flag columns to bool dtype once, right after parsing
+
+    A CSV round trip leaves these as object/str columns; coercing here
+    means every downstream mask is a contiguous numpy bool array instead
+    of an object comparison.
+    """
+    for col in _FLAG_COLUMNS:
+        if col in df.columns:
+            series = df[col]
+            if series.dtype != bool:
+                if series.dtype == object:
+                    series = series.map({'True': True, 'False': False, True: True, False: False})
+                df[col] = series.fillna(False).astype(bool)
+    return df
+
+
+@functools.lru_cache(maxsize=32)
+def _load_matches_cached(path_str, mtime_ns):
+    """Parse a matches table, memoized per (path, mtime)
+
+    Prefers the feather sidecar written by _save_matches when it is at
+    least as new as the CSV; a hand-edited CSV is newer and wins.
+    """
+    output_csv = Path(path_str)
+    feather = _matches_feather(output_csv)
+    try:
+        if feather.exists() and feather.stat().st_mtime_ns >= mtime_ns:
+            return _coerce_flag_columns(pd.read_feather(feather))
+    except Exception as e:
+        logger.warning(f"Feather sidecar unreadable for {output_csv.name}, using CSV: {e}")
+
+    return _coerce_flag_columns(_read_matches_csv(path_str))
+
+
+@functools.lru_cache(maxsize=128)
+def _detect_delimiter(path_str, mtime_ns):
+    """Sniff a statement file's delimiter, memoized per (path, mtime)"""
+    with open(path_str, 'r', encoding='utf-8-sig') as f:
+        first_line = f.readline()
+
+    # One pass over the header bytes instead of three str.count scans;
+    # UTF-8 continuation bytes can never alias the ASCII delimiters
+    data = np.frombuffer(first_line.encode('utf-8'), dtype=np.uint8)
+    semicolons = int(np.count_nonzero(data == 0x3b))
+    commas = int(np.count_nonzero(data == 0x2c))
+    tabs = int(np.count_nonzero(data == 0x09))
+
+    if semicolons > commas:
+        return ';'
+    if commas > 0:
+        return ','
+    if tabs > 0:
+        return '\t'
+    return ';'
+
+
+# Shared keywords for original-statement reads: memory_map hands the C
+# engine a zero-copy view of the file (repeat reads come straight from
+# page cache), and low_memory=False skips chunked type inference that
+# only pays off on files far larger than a bank statement.
+_ORIGINAL_READ_KW = dict(encoding='utf-8-sig', memory_map=True,
+                         low_memory=False)
+
+
+@functools.lru_cache(maxsize=32)
+def _load_original_cached(path_str, mtime_ns):
+    """Parse an original statement file, memoized per (path, mtime)"""
+    statement_file = Path(path_str)
+    delimiter = _detect_delimiter(path_str, mtime_ns)
+
+    # Try to read with headers first
+    try:
+        df = pd.read_csv(statement_file, sep=delimiter, dtype=_MATCHES_DTYPES,
+                         **_ORIGINAL_READ_KW)
+
+        # Check if it looks like there are no headers (first row contains data)
+        # If first column name looks like a date pattern or number, probably no headers
+        first_col = str(df.columns[0])
+        has_headers = True
+
+        # Check if first column looks like data (date pattern or pure numbers)
+        if (any(char.isdigit() for char in first_col) and
+            ('.' in first_col or '/' in first_col or first_col.replace('.', '').replace('/', '').isdigit())):
+            has_headers = False
+
+        if not has_headers:
+            # Reload without headers
+            df = pd.read_csv(statement_file, sep=delimiter, header=None,
+                             **_ORIGINAL_READ_KW)
+            # Use German column names that the app expects
+            if len(df.columns) >= 3:
+                df.columns = ['Buchungstag', 'Verwendungszweck', 'Betrag'] + [f'Col{i}' for i in range(3, len(df.columns))]
+            else:
+                df.columns = [f'Col{i}' for i in range(len(df.columns))]
+            logger.info(f"No headers detected, assigned columns: {df.columns.tolist()}")
+        else:
+            # Has headers - map common English names to German if needed
+            column_mapping = {
+                'Date': 'Buchungstag',
+                'Description': 'Verwendungszweck',
+                'Amount': 'Betrag'
+            }
+            df.rename(columns=column_mapping, inplace=True)
+            logger.info(f"Headers detected: {df.columns.tolist()}")
+
+    except Exception as e:
+        logger.error(f"Error reading CSV: {e}")
+        df = pd.read_csv(statement_file, sep=delimiter, header=None,
+                         **_ORIGINAL_READ_KW)
+        # Use German column names
+        if len(df.columns) >= 3:
+            df.columns = ['Buchungstag', 'Verwendungszweck', 'Betrag'] + [f'Col{i}' for i in range(3, len(df.columns))]
+        else:
+            df.columns = [f'Col{i}' for i in range(len(df.columns))]
+
+    return _coerce_flag_columns(_ensure_columns(df))
+
+
 def load_statement_data(statement_name=None):
     """Load statement data with match status"""
     if not statement_name:
@@ -117,91 +548,48 @@ def load_statement_data(statement_name=None):
         if not all_statements:
             return pd.DataFrame()
         statement_name = all_statements[0]['name']
-    
+
     # Find the statement file in its folder
     statement_folder = get_statement_folder(statement_name)
     statement_file = statement_folder / statement_name
     output_csv = statement_folder / f"{statement_name.rsplit('.', 1)[0]}_matches.csv"
-    
+
     if not statement_file.exists():
         return pd.DataFrame()
-    
-    # Load from output if exists, otherwise from original
+
+    # Load from output if exists, otherwise from original. Both reads are
+    # memoized on (path, mtime), so repeated dashboard polls skip the
+    # CSV parse entirely; a write bumps the mtime and misses the cache.
     if output_csv.exists():
-        df = pd.read_csv(output_csv, sep=';', encoding='utf-8-sig')
+        df = _load_matches_cached(str(output_csv), output_csv.stat().st_mtime_ns)
     else:
-        # Auto-detect delimiter
-        with open(statement_file, 'r', encoding='utf-8-sig') as f:
-            first_line = f.readline()
-            if first_line.count(';') > first_line.count(','):
-                delimiter = ';'
-            elif first_line.count(',') > 0:
-                delimiter = ','
-            elif first_line.count('\t') > 0:
-                delimiter = '\t'
-            else:
-                delimiter = ';'
-        
-        # Try to read with headers first
-        try:
-            df = pd.read_csv(statement_file, sep=delimiter, encoding='utf-8-sig')
-            
-            # Check if it looks like there are no headers (first row contains data)
-            # If first column name looks like a date pattern or number, probably no headers
-            first_col = str(df.columns[0])
-            has_headers = True
-            
-            # Check if first column looks like data (date pattern or pure numbers)
-            if (any(char.isdigit() for char in first_col) and 
-                ('.' in first_col or '/' in first_col or first_col.replace('.', '').replace('/', '').isdigit())):
-                has_headers = False
-            
-            if not has_headers:
-                # Reload without headers
-                df = pd.read_csv(statement_file, sep=delimiter, encoding='utf-8-sig', header=None)
-                # Use German column names that the app expects
-                if len(df.columns) >= 3:
-                    df.columns = ['Buchungstag', 'Verwendungszweck', 'Betrag'] + [f'Col{i}' for i in range(3, len(df.columns))]
-                else:
-                    df.columns = [f'Col{i}' for i in range(len(df.columns))]
-                logger.info(f"No headers detected, assigned columns: {df.columns.tolist()}")
-            else:
-                # Has headers - map common English names to German if needed
-                column_mapping = {
-                    'Date': 'Buchungstag',
-                    'Description': 'Verwendungszweck', 
-                    'Amount': 'Betrag'
-                }
-                df.rename(columns=column_mapping, inplace=True)
-                logger.info(f"Headers detected: {df.columns.tolist()}")
-                
-        except Exception as e:
-            logger.error(f"Error reading CSV: {e}")
-            df = pd.read_csv(statement_file, sep=delimiter, encoding='utf-8-sig', header=None)
-            # Use German column names
-            if len(df.columns) >= 3:
-                df.columns = ['Buchungstag', 'Verwendungszweck', 'Betrag'] + [f'Col{i}' for i in range(3, len(df.columns))]
-            else:
-                df.columns = [f'Col{i}' for i in range(len(df.columns))]
-        
-        # Add match status columns if they don't exist
-        if 'Matching Receipt Found' not in df.columns:
-            df['Matching Receipt Found'] = False
-            df['Matched Receipt File'] = ''
-            df['Match Confidence'] = 0
-        if 'No Receipt Needed' not in df.columns:
-            df['No Receipt Needed'] = False
-        if 'Manually_Unmatched' not in df.columns:
-            df['Manually_Unmatched'] = False
-    
+        df = _load_original_cached(str(statement_file), statement_file.stat().st_mtime_ns)
+
+    # Copy so callers mutating the frame don't poison the cache
+    df = df.copy()
+
+    # Merge any pending checkbox toggles that haven't been flushed to the
+    # canonical files yet
+    overrides = _load_overrides(_overrides_path(output_csv))
+    if overrides:
+        _apply_overrides(df, overrides)
+
     return df
 
 
 def get_summary_stats(df):
     """Calculate summary statistics"""
-    total = int(len(df))
-    matched = int(df['Matching Receipt Found'].sum()) if 'Matching Receipt Found' in df.columns else 0
-    no_receipt_needed = int(df['No Receipt Needed'].sum()) if 'No Receipt Needed' in df.columns else 0
+    total = len(df)
+
+    # count_nonzero over the contiguous bool buffers skips the pandas
+    # Series.sum dispatch - one C reduction per counter
+    def _count(name):
+        if name not in df.columns:
+            return 0
+        return int(np.count_nonzero(df[name].to_numpy(dtype=bool, copy=False)))
+
+    matched = _count('Matching Receipt Found')
+    no_receipt_needed = _count('No Receipt Needed')
     completed = matched + no_receipt_needed
     missing = total - completed
     completion_rate = float((completed / total * 100) if total > 0 else 0)
@@ -216,17 +604,204 @@ def get_summary_stats(df):
     }
 
 
+# Mtime-keyed memo for summary counters - repeated /api/summary polls
+# between writes are a dict hit, no frame access at all
+_counts_cache = {}
+
+
+def load_statement_counts(statement_name=None):
+    """Summary counters for a statement without copying the full frame
+
+    api_summary only needs four counters, so this reads the memoized
+    frame directly (sums are read-only - no defensive copy) and adjusts
+    for pending overrides arithmetically instead of materializing a
+    merged copy the way load_statement_data does.
+    """
+    if not statement_name:
+        all_statements = get_all_statements()
+        if not all_statements:
+            return get_summary_stats(pd.DataFrame())
+        statement_name = all_statements[0]['name']
+
+    statement_folder = get_statement_folder(statement_name)
+    statement_file = statement_folder / statement_name
+    output_csv = statement_folder / f"{statement_name.rsplit('.', 1)[0]}_matches.csv"
+
+    if not statement_file.exists():
+        return get_summary_stats(pd.DataFrame())
+
+    overrides_path = _overrides_path(output_csv)
+    try:
+        overrides_mtime = overrides_path.stat().st_mtime_ns
+    except OSError:
+        overrides_mtime = 0
+
+    if output_csv.exists():
+        source, mtime_ns = str(output_csv), output_csv.stat().st_mtime_ns
+        loader = _load_matches_cached
+    else:
+        source, mtime_ns = str(statement_file), statement_file.stat().st_mtime_ns
+        loader = _load_original_cached
+
+    key = (source, mtime_ns, overrides_mtime)
+    cached = _counts_cache.get(key)
+    if cached is not None:
+        return dict(cached)
+
+    df = loader(source, mtime_ns)
+    stats = get_summary_stats(df)
+
+    overrides = _load_overrides(overrides_path) if overrides_mtime else {}
+    if overrides and 'No Receipt Needed' in df.columns:
+        column = df['No Receipt Needed']
+        n = len(df)
+        delta = 0
+        for idx, entry in overrides.items():
+            value = entry.get('no_receipt_needed')
+            if value is not None and 0 <= idx < n and value != bool(column.iloc[idx]):
+                delta += 1 if value else -1
+        if delta:
+            stats['no_receipt_needed'] += delta
+            stats['completed'] += delta
+            stats['missing'] -= delta
+            stats['completion_rate'] = round(
+                stats['completed'] / stats['total'] * 100, 1) if stats['total'] else 0.0
+
+    if len(_counts_cache) > 64:
+        _counts_cache.clear()
+    _counts_cache[key] = dict(stats)
+    return stats
+
+
+def _json_response(payload):
+    """Serialize a JSON payload with orjson when available
+
+    orjson is a C extension that serializes several times faster than the
+    stdlib encoder jsonify uses, and it emits numpy scalars natively -
+    this matters on /api/transactions, where large statements produce
+    multi-MB responses.
+    """
+    if orjson is None:
+        return jsonify(payload)
+    return app.response_class(
+        orjson.dumps(payload, option=orjson.OPT_SERIALIZE_NUMPY),
+        mimetype='application/json'
+    )
+
+
+def _statement_etag(statement_name):
+    """Weak ETag + Last-Modified timestamp for a statement's JSON views
+
+    Derived from the newest mtime across the inputs those views read:
+    the statement file, matches CSV and its sidecars, and the receipt
+    folders (including their entries, so an overwritten PDF still bumps
+    the tag). Without a statement it covers the base folder listing.
+
+    Returns:
+        Tuple of (etag, last_modified_ts) or None if nothing stat-able
+    """
+    mtimes = []
+    count = 0
+
+    if statement_name:
+        folder = get_statement_folder(statement_name)
+        stem = statement_name.rsplit('.', 1)[0]
+        output_csv = folder / f"{stem}_matches.csv"
+        candidates = [folder / statement_name, output_csv,
+                      _matches_feather(output_csv), _overrides_path(output_csv)]
+        for path in candidates:
+            try:
+                mtimes.append(path.stat().st_mtime_ns)
+            except OSError:
+                continue
+        scan_dirs = [folder / 'receipts', folder / 'matched_receipts']
+    else:
+        scan_dirs = [STATEMENTS_BASE_FOLDER]
+
+    for scan_dir in scan_dirs:
+        try:
+            with os.scandir(scan_dir) as it:
+                for entry in it:
+                    mtimes.append(entry.stat().st_mtime_ns)
+                    count += 1
+        except OSError:
+            continue
+
+    if not mtimes:
+        return None
+
+    newest = max(mtimes)
+    return f'{newest:x}-{count:x}', newest / 1e9
+
+
+def conditional_get(view):
+    """Answer repeat polls with 304 when the underlying files are unchanged
+
+    Computing the tag is a handful of stat calls - far cheaper than the
+    CSV parse and list-of-dicts serialization the wrapped view does.
+    """
+    @functools.wraps(view)
+    def wrapper(*args, **kwargs):
+        tag = _statement_etag(request.args.get('statement'))
+        if tag is not None and request.if_none_match.contains_weak(tag[0]):
+            return '', 304
+
+        response = view(*args, **kwargs)
+        if tag is not None and isinstance(response, app.response_class) \
+                and response.status_code == 200:
+            response.set_etag(tag[0], weak=True)
+            response.last_modified = tag[1]
+            response.headers['Cache-Control'] = 'private, must-revalidate'
+        return response
+
+    return wrapper
+
+
+# Listing cache keyed per folder on its mtime: dashboard polls between
+# receipt moves reuse the DirEntry objects (and their cached stat
+# results) instead of re-walking the directory on every request. Moves,
+# renames and deletes all bump the parent directory's mtime, so the key
+# rolls over exactly when the listing changes.
+_pdf_listing_cache = {}
+
+
+def _list_pdfs(folder):
+    """List PDF DirEntry objects in a folder (empty list if missing)
+
+    scandir returns entries carrying type info and a cached stat(), so
+    callers reading size/mtime don't pay an extra syscall per file the
+    way Path.glob + Path.stat() does. Listings are memoized per folder
+    mtime; callers must not mutate the returned list.
+    """
+    try:
+        dir_mtime = os.stat(folder).st_mtime_ns
+    except OSError:
+        return []
+
+    key = str(folder)
+    cached = _pdf_listing_cache.get(key)
+    if cached is not None and cached[0] == dir_mtime:
+        return cached[1]
+
+    try:
+        with os.scandir(folder) as it:
+            entries = [e for e in it if e.is_file() and e.name.lower().endswith('.pdf')]
+    except OSError:
+        return []
+
+    if len(_pdf_listing_cache) > 256:
+        _pdf_listing_cache.clear()
+    _pdf_listing_cache[key] = (dir_mtime, entries)
+    return entries
+
+
 def scan_receipts(statement_name=None):
     """Scan receipts folder for a specific statement"""
     if not statement_name:
         return 0
-    
+
     receipts_folder = get_statement_receipts_folder(statement_name, 'receipts')
-    if not receipts_folder.exists():
-        return 0
-    
-    receipts = list(receipts_folder.glob("*.pdf"))
-    return len(receipts)
+    return len(_list_pdfs(receipts_folder))
 
 
 @app.route('/')
@@ -236,6 +811,7 @@ def index():
 
 
 @app.route('/api/statements')
+@conditional_get
 def api_statements():
     """Get list of available statements"""
     try:
@@ -271,18 +847,18 @@ def api_debug_columns():
 
 
 @app.route('/api/summary')
+@conditional_get
 def api_summary():
     """Get summary statistics"""
     try:
         statement_name = request.args.get('statement')
-        df = load_statement_data(statement_name)
-        stats = get_summary_stats(df)
-        
+        stats = load_statement_counts(statement_name)
+
         # Add receipt counts for this statement
         if statement_name:
             stats['receipts_in_folder'] = scan_receipts(statement_name)
             matched_folder = get_statement_receipts_folder(statement_name, 'matched_receipts')
-            stats['receipts_renamed'] = len(list(matched_folder.glob("*.pdf"))) if matched_folder.exists() else 0
+            stats['receipts_renamed'] = len(_list_pdfs(matched_folder))
         else:
             stats['receipts_in_folder'] = 0
             stats['receipts_renamed'] = 0
@@ -293,6 +869,7 @@ def api_summary():
 
 
 @app.route('/api/transactions')
+@conditional_get
 def api_transactions():
     """Get all transactions"""
     try:
@@ -301,48 +878,81 @@ def api_transactions():
         
         # Check if dataframe is empty
         if df.empty:
-            return jsonify([])
-        
+            return _json_response([])
+
         # Get filter from query params
         filter_type = request.args.get('filter', 'all')
         
+        # Flag columns are bool dtype from load, so these masks run on a
+        # contiguous numpy bool array - no object-dtype comparison
         if filter_type == 'matched':
-            df = df[df['Matching Receipt Found'] == True]
+            df = df[df['Matching Receipt Found'].values]
         elif filter_type == 'unmatched':
-            df = df[df['Matching Receipt Found'] == False]
-        
-        # Convert to list of dicts
-        transactions = []
-        for idx, row in df.iterrows():
-            # Safely access columns with proper pandas Series handling
-            # Use column name in brackets with fallback for missing columns
-            date = row['Buchungstag'] if 'Buchungstag' in df.columns else ''
-            amount = row['Betrag'] if 'Betrag' in df.columns else '0.00'
-            
-            # Try multiple possible description column names
-            if 'Verwendungszweck' in df.columns:
-                description = row['Verwendungszweck']
-            elif 'Task' in df.columns:
-                description = row['Task']
-            elif 'Description' in df.columns:
-                description = row['Description']
-            else:
-                description = ''
-            
-            transactions.append({
-                'row': idx + 2,  # +2 for header and 0-index
-                'date': str(date) if pd.notna(date) else '',
-                'amount': str(amount) if pd.notna(amount) else '0.00',
-                'description': str(description)[:100] if pd.notna(description) else '',
-                'matched': bool(row['Matching Receipt Found']) if 'Matching Receipt Found' in df.columns and pd.notna(row['Matching Receipt Found']) else False,
-                'no_receipt_needed': bool(row['No Receipt Needed']) if 'No Receipt Needed' in df.columns and pd.notna(row['No Receipt Needed']) else False,
-                'receipt': str(row['Matched Receipt File']) if 'Matched Receipt File' in df.columns and pd.notna(row['Matched Receipt File']) else '',
-                'confidence': int(row['Match Confidence']) if 'Match Confidence' in df.columns and pd.notna(row['Match Confidence']) else 0,
-                'owner_mark': bool(row['Owner_Mark']) if 'Owner_Mark' in df.columns and pd.notna(row['Owner_Mark']) else False,
-                'owner_flo': bool(row['Owner_Flo']) if 'Owner_Flo' in df.columns and pd.notna(row['Owner_Flo']) else False
-            })
-        
-        return jsonify(transactions)
+            df = df[~df['Matching Receipt Found'].values]
+        
+        # Extract each column once with vectorized ops instead of
+        # iterrows(), which boxes every row into a Series
+        n = len(df)
+
+        def _text_column(series, default, width=None):
+            """NaN-safe string extraction for a whole column"""
+            values = series.astype(str)
+            if width is not None:
+                values = values.str.slice(0, width)
+            return values.where(series.notna(), default).tolist()
+
+        def _flag_column(name):
+            if name in df.columns:
+                return df[name].fillna(False).astype(bool).tolist()
+            return [False] * n
+
+        dates = _text_column(df['Buchungstag'], '') if 'Buchungstag' in df.columns else [''] * n
+        amounts = _text_column(df['Betrag'], '0.00') if 'Betrag' in df.columns else ['0.00'] * n
+
+        # Try multiple possible description column names
+        descriptions = [''] * n
+        for desc_col in ('Verwendungszweck', 'Task', 'Description'):
+            if desc_col in df.columns:
+                descriptions = _text_column(df[desc_col], '', width=100)
+                break
+
+        matched = _flag_column('Matching Receipt Found')
+        no_receipt = _flag_column('No Receipt Needed')
+        owner_mark = _flag_column('Owner_Mark')
+        owner_flo = _flag_column('Owner_Flo')
+
+        if 'Matched Receipt File' in df.columns:
+            receipts = _text_column(df['Matched Receipt File'], '')
+        else:
+            receipts = [''] * n
+
+        if 'Match Confidence' in df.columns:
+            confidences = df['Match Confidence'].fillna(0).astype(int).tolist()
+        else:
+            confidences = [0] * n
+
+        rows = (df.index.to_numpy() + 2).tolist()  # +2 for header and 0-index
+
+        transactions = [
+            {
+                'row': row,
+                'date': date,
+                'amount': amount,
+                'description': description,
+                'matched': is_matched,
+                'no_receipt_needed': no_receipt_needed,
+                'receipt': receipt,
+                'confidence': confidence,
+                'owner_mark': mark,
+                'owner_flo': flo
+            }
+            for row, date, amount, description, is_matched, no_receipt_needed,
+                receipt, confidence, mark, flo in zip(
+                    rows, dates, amounts, descriptions, matched, no_receipt,
+                    receipts, confidences, owner_mark, owner_flo)
+        ]
+
+        return _json_response(transactions)
     except Exception as e:
         logger.error(f"Error in api_transactions: {e}")
         logger.error(f"Available columns: {df.columns.tolist() if 'df' in locals() else 'No df loaded'}")
@@ -350,6 +960,7 @@ def api_transactions():
 
 
 @app.route('/api/receipts')
+@conditional_get
 def api_receipts():
     """Get list of receipts for a specific statement"""
     try:
@@ -358,21 +969,21 @@ def api_receipts():
             return jsonify([])
         
         receipts_folder = get_statement_receipts_folder(statement_name, 'receipts')
-        if not receipts_folder.exists():
-            return jsonify([])
-        
-        receipts = list(receipts_folder.glob("*.pdf"))
+
+        # Relative prefix computed once; DirEntry.stat() is cached from
+        # the scandir pass, so this is one syscall per file total
+        rel_folder = str(receipts_folder.relative_to(BASE_DIR))
         receipt_list = []
-        
-        for receipt in receipts:
-            stat = receipt.stat()
+
+        for entry in _list_pdfs(receipts_folder):
+            stat = entry.stat()
             receipt_list.append({
-                'name': receipt.name,
+                'name': entry.name,
                 'size': stat.st_size,
-                'modified': datetime.fromtimestamp(stat.st_mtime).isoformat(),
-                'path': str(receipt.relative_to(BASE_DIR))
+                'modified': _iso_mtime(stat.st_mtime),
+                'path': f"{rel_folder}/{entry.name}"
             })
-        
+
         # Sort by modified date (newest first)
         receipt_list.sort(key=lambda x: x['modified'], reverse=True)
         
@@ -382,6 +993,7 @@ def api_receipts():
 
 
 @app.route('/api/renamed-receipts')
+@conditional_get
 def api_renamed_receipts():
     """Get list of matched/renamed receipts for a specific statement"""
     try:
@@ -390,24 +1002,27 @@ def api_renamed_receipts():
             return jsonify([])
         
         matched_folder = get_statement_receipts_folder(statement_name, 'matched_receipts')
-        if not matched_folder.exists():
-            return jsonify([])
-        
-        receipts = list(matched_folder.glob("*.pdf"))
+
+        rel_folder = str(matched_folder.relative_to(BASE_DIR))
+
+        # Matched names are 'NNN_merchant.pdf': sort on the parsed row
+        # number (one int per file) rather than string-comparing names,
+        # with non-conforming names sinking to the end. sorted() makes a
+        # private copy - the list from _list_pdfs is shared via its cache
+        # and must not be mutated
+        entries = sorted(_list_pdfs(matched_folder),
+                         key=lambda e: int(e.name[:3]) if e.name[:3].isdigit() else 1 << 30)
+
         receipt_list = []
-        
-        for receipt in receipts:
-            stat = receipt.stat()
+        for entry in entries:
+            stat = entry.stat()
             receipt_list.append({
-                'name': receipt.name,
+                'name': entry.name,
                 'size': stat.st_size,
-                'modified': datetime.fromtimestamp(stat.st_mtime).isoformat(),
-                'path': str(receipt.relative_to(BASE_DIR))
+                'modified': _iso_mtime(stat.st_mtime),
+                'path': f"{rel_folder}/{entry.name}"
             })
         
-        # Sort by name (row number)
-        receipt_list.sort(key=lambda x: x['name'])
-        
         return jsonify(receipt_list)
     except Exception as e:
         return jsonify({'error': str(e)}), 500
@@ -424,7 +1039,7 @@ def upload_statement():
         if file.filename == '':
             return jsonify({'error': 'No file selected'}), 400
         
-        if not allowed_file(file.filename, ALLOWED_STATEMENT_EXTENSIONS):
+        if not allowed_file(file.filename, _ALLOWED_STMT_SUFFIXES):
             return jsonify({'error': 'Invalid file type. Only CSV, XLS, XLSX allowed'}), 400
         
         filename = secure_filename(file.filename)
@@ -432,10 +1047,10 @@ def upload_statement():
         # Create folders for this statement
         folders = create_statement_folders(filename)
         
-        # Save statement file to its folder
+        # Save statement file to its folder (1 MiB blocks, same as receipts)
         filepath = folders['base'] / filename
-        file.save(filepath)
-        
+        _save_upload(file, filepath)
+
         return jsonify({
             'success': True,
             'filename': filename,
@@ -462,24 +1077,36 @@ def upload_receipt():
             return jsonify({'error': 'No statement specified'}), 400
         
         files = request.files.getlist('files')
-        uploaded = []
-        
+
         # Get receipts folder for this statement
         receipts_folder = get_statement_receipts_folder(statement_name, 'receipts')
         receipts_folder.mkdir(parents=True, exist_ok=True)
         
+        # Validate everything first, then fan the saves out to the I/O
+        # pool - werkzeug has already spooled each part to temp storage,
+        # so the writes are independent and can proceed in parallel.
+        # Sanitize once and split the extension once per file instead of
+        # the separate allowed_file + secure_filename passes.
+        to_save = []
         for file in files:
-            if file.filename == '':
+            if not file.filename:
                 continue
-            
-            if not allowed_file(file.filename, ALLOWED_RECEIPT_EXTENSIONS):
-                continue
-            
+
             filename = secure_filename(file.filename)
-            filepath = receipts_folder / filename
-            file.save(filepath)
-            uploaded.append(filename)
-        
+            stem, dot, ext = filename.rpartition('.')
+            if not dot or ext.lower() not in ALLOWED_RECEIPT_EXTENSIONS:
+                continue
+
+            to_save.append((file, receipts_folder / filename, filename))
+
+        futures = [_io_executor.submit(_save_upload, file, filepath)
+                   for file, filepath, _ in to_save]
+        wait(futures)
+        for future in futures:
+            future.result()  # surface any write error as a 500
+
+        uploaded = [filename for _, _, filename in to_save]
+
         return jsonify({
             'success': True,
             'count': len(uploaded),
@@ -501,42 +1128,29 @@ def toggle_no_receipt():
         
         if not statement_name or row_index is None:
             return jsonify({'error': 'Missing statement or row'}), 400
-        
-        # Load the data
+
         statement_folder = get_statement_folder(statement_name)
-        statement_file = statement_folder / statement_name
         output_csv = statement_folder / f"{statement_name.rsplit('.', 1)[0]}_matches.csv"
-        
-        # Load from output if exists, otherwise from original
-        if output_csv.exists():
-            df = pd.read_csv(output_csv, sep=';', encoding='utf-8-sig')
-        else:
-            df = pd.read_csv(statement_file, sep=';', encoding='utf-8-sig')
-            # Add columns if they don't exist
-            if 'Matching Receipt Found' not in df.columns:
-                df['Matching Receipt Found'] = False
-                df['Matched Receipt File'] = ''
-                df['Match Confidence'] = 0
-            if 'No Receipt Needed' not in df.columns:
-                df['No Receipt Needed'] = False
-        
-        # Ensure column exists
-        if 'No Receipt Needed' not in df.columns:
-            df['No Receipt Needed'] = False
-        
+
         # Convert row number to dataframe index (row - 2 because of header and 0-index)
         df_index = row_index - 2
-        
+
+        # Bounds check against the cached load - right after a dashboard
+        # render this is a cache hit, so no CSV parse happens here
+        df = load_statement_data(statement_name)
         if df_index < 0 or df_index >= len(df):
             return jsonify({'error': 'Invalid row index'}), 400
-        
-        # Update the value
-        df.loc[df_index, 'No Receipt Needed'] = checked
-        
-        # Save to output CSV
-        output_csv.parent.mkdir(parents=True, exist_ok=True)
-        df.to_csv(output_csv, sep=';', index=False, encoding='utf-8-sig')
-        
+
+        # A checkbox click only touches one cell, so record it in the tiny
+        # overrides sidecar instead of rewriting the whole matches CSV.
+        # Readers merge the sidecar on load; the next full save flushes it
+        # into the canonical files.
+        overrides_path = _overrides_path(output_csv)
+        overrides = _load_overrides(overrides_path)
+        overrides.setdefault(df_index, {})['no_receipt_needed'] = bool(checked)
+        statement_folder.mkdir(parents=True, exist_ok=True)
+        _save_overrides(overrides_path, overrides)
+
         return jsonify({
             'success': True,
             'row': row_index,
@@ -564,10 +1178,12 @@ def match_receipts():
         if not receipts_folder.exists():
             return jsonify({'error': 'No receipts folder found'}), 400
         
-        # Import matching components
-        from src.receipt_processor import ReceiptProcessor
+        # Matching pulls in the pdf/OCR stack, so defer those imports to
+        # the one endpoint that needs them instead of paying at boot
         from src.matcher import ReceiptMatcher
-        
+        from src.receipt_processor import ReceiptProcessor
+        from src.statement_parser import StatementParser
+
         # Process receipts
         processor = ReceiptProcessor(str(receipts_folder))
         receipts = processor.process_all_receipts()
@@ -584,12 +1200,9 @@ def match_receipts():
             description_column='Verwendungszweck'
         )
         
-        # Load original CSV to preserve all columns and match status
-        if output_csv.exists():
-            original_df = pd.read_csv(output_csv, sep=';', encoding='utf-8-sig', dtype={'Matched Receipt File': str})
-        else:
-            # Use load_statement_data to get properly parsed CSV with correct delimiter
-            original_df = load_statement_data(statement_name)
+        # Load via the cached loader (prefers the feather sidecar) to
+        # preserve all columns and match status
+        original_df = load_statement_data(statement_name)
         
         # Ensure correct dtypes for match columns
         if 'Matched Receipt File' in original_df.columns:
@@ -599,26 +1212,39 @@ def match_receipts():
         if 'Manually_Unmatched' not in original_df.columns:
             original_df['Manually_Unmatched'] = False
         
-        # Get unmatched transactions from parsed data - exclude manually unmatched ones
-        unmatched_mask = (original_df['Matching Receipt Found'] == False) & (original_df['Manually_Unmatched'] == False)
-        unmatched_indices = original_df[unmatched_mask].index.tolist()
-        
-        # Get parsed transactions for unmatched rows
-        transactions = []
-        for idx in unmatched_indices:
-            transactions.append({
-                'original_index': idx,
-                'date': parsed_df.loc[idx, 'date'],
-                'amount': parsed_df.loc[idx, 'amount'],
-                'description': parsed_df.loc[idx, 'description']
-            })
+        # Get unmatched transactions from parsed data - exclude manually
+        # unmatched ones; flatnonzero over the bool buffers avoids
+        # materializing the filtered frame just for its index
+        unmatched_indices = np.flatnonzero(
+            ~original_df['Matching Receipt Found'].to_numpy(dtype=bool, copy=False)
+            & ~original_df['Manually_Unmatched'].to_numpy(dtype=bool, copy=False)
+        ).tolist()
+        
+        # Get parsed transactions for unmatched rows: one slice plus
+        # aligned column lists instead of a .loc round trip per cell.
+        # The parse itself stays full-file - skiprows would renumber the
+        # index and break the original_index mapping into original_df.
+        unmatched_parsed = parsed_df.loc[unmatched_indices]
+        transactions = [
+            {'original_index': idx, 'date': date, 'amount': amount,
+             'description': description}
+            for idx, date, amount, description in zip(
+                unmatched_indices,
+                unmatched_parsed['date'].tolist(),
+                unmatched_parsed['amount'].tolist(),
+                unmatched_parsed['description'].tolist())
+        ]
         
         # Match
         matcher = ReceiptMatcher()
         results = matcher.match_all_transactions(transactions, receipts)
         
-        # Update dataframe
-        matched_count = 0
+        # Move files first, accumulating the frame updates so they can be
+        # applied as one batched assignment per column instead of three
+        # .loc dispatches per match
+        matched_idx = []
+        matched_files = []
+        confidences = []
         for result in results:
             if result['matched']:
                 transaction = result['transaction']
@@ -628,29 +1254,32 @@ def match_receipts():
                 # IMPORTANT: Rename/move receipt FIRST, then update CSV with new name
                 row_num = original_idx + 2  # +2 for header and 0-index
                 # Use merchant from receipt if available
-                import re
                 clean_merchant = receipt.get('merchant', 'Unknown').strip()[:50]
-                clean_merchant = re.sub(r'[^\w\s-]', '', clean_merchant)
+                clean_merchant = _FN_SANITIZE.sub('', clean_merchant)
                 
                 new_filename = f"{row_num:03d}_{clean_merchant}.pdf"
                 original_path = Path(receipt['path'])
                 new_path = matched_folder / new_filename
                 
-                # Move/rename the file
+                # Move/rename the file - both folders live under the
+                # statement dir, so rename is an O(1) metadata op; only
+                # fall back to copy+unlink across filesystem boundaries
                 if original_path.exists():
                     matched_folder.mkdir(parents=True, exist_ok=True)
-                    shutil.copy2(original_path, new_path)
-                    original_path.unlink()  # Remove from receipts folder
+                    _fast_move(original_path, new_path)
                 
-                # NOW update CSV with the NEW filename
-                original_df.loc[original_idx, 'Matching Receipt Found'] = True
-                original_df.loc[original_idx, 'Matched Receipt File'] = new_filename  # Use NEW name
-                original_df.loc[original_idx, 'Match Confidence'] = result['confidence']
-                
-                matched_count += 1
+                matched_idx.append(original_idx)
+                matched_files.append(new_filename)
+                confidences.append(result['confidence'])
+        
+        matched_count = len(matched_idx)
+        if matched_idx:
+            original_df.loc[matched_idx, 'Matching Receipt Found'] = True
+            original_df.loc[matched_idx, 'Matched Receipt File'] = matched_files
+            original_df.loc[matched_idx, 'Match Confidence'] = confidences
         
         # Save updated CSV
-        original_df.to_csv(output_csv, sep=';', index=False, encoding='utf-8-sig')
+        _save_matches(original_df, output_csv)
         
         return jsonify({
             'success': True,
@@ -660,7 +1289,6 @@ def match_receipts():
         })
         
     except Exception as e:
-        import traceback
         traceback.print_exc()
         return jsonify({'error': str(e)}), 500
 
@@ -669,11 +1297,21 @@ def match_receipts():
 def download_file(filepath):
     """Download a file"""
     try:
-        file_path = BASE_DIR / filepath
-        if file_path.exists() and file_path.is_file():
-            return send_file(file_path, as_attachment=True)
-        else:
+        # Resolve and confine to BASE_DIR, then stat exactly once - a
+        # traversal attempt and a missing file both read as 404
+        try:
+            file_path = validate_path_traversal(BASE_DIR, BASE_DIR / filepath)
+            st = file_path.stat()
+        except (SecurityError, OSError):
+            return jsonify({'error': 'File not found'}), 404
+
+        if not S_ISREG(st.st_mode):
             return jsonify({'error': 'File not found'}), 404
+
+        # conditional=True lets browsers revalidate with If-Modified-Since
+        # and issue range requests instead of re-downloading whole PDFs
+        return send_file(file_path, as_attachment=True, conditional=True,
+                         last_modified=st.st_mtime, max_age=3600)
     except Exception as e:
         return jsonify({'error': str(e)}), 500
 
@@ -682,19 +1320,25 @@ def download_file(filepath):
 def view_file(filepath):
     """View a file inline (for PDF preview)"""
     try:
-        logger.info(f"view_file called with filepath: {filepath}")
-        file_path = BASE_DIR / filepath
-        logger.info(f"Constructed file_path: {file_path}")
-        logger.info(f"File exists: {file_path.exists()}, Is file: {file_path.is_file() if file_path.exists() else 'N/A'}")
-        
-        if file_path.exists() and file_path.is_file():
-            # Determine mimetype
-            ext = file_path.suffix.lower()
-            mimetype = 'application/pdf' if ext == '.pdf' else 'image/png' if ext == '.png' else 'application/octet-stream'
-            return send_file(file_path, mimetype=mimetype, as_attachment=False)
-        else:
-            logger.error(f"File not found: {file_path}")
+        # Resolve and confine to BASE_DIR, then stat exactly once - a
+        # traversal attempt and a missing file both read as 404
+        try:
+            file_path = validate_path_traversal(BASE_DIR, BASE_DIR / filepath)
+            st = file_path.stat()
+        except (SecurityError, OSError):
+            logger.error(f"File not found: {filepath}")
             return jsonify({'error': 'File not found'}), 404
+
+        if not S_ISREG(st.st_mode):
+            logger.error(f"File not found: {filepath}")
+            return jsonify({'error': 'File not found'}), 404
+
+        # Determine mimetype
+        ext = file_path.suffix.lower()
+        mimetype = 'application/pdf' if ext == '.pdf' else 'image/png' if ext == '.png' else 'application/octet-stream'
+        return send_file(file_path, mimetype=mimetype, as_attachment=False,
+                         conditional=True, last_modified=st.st_mtime,
+                         max_age=3600)
     except Exception as e:
         logger.error(f"Error in view_file: {str(e)}")
         return jsonify({'error': str(e)}), 500
@@ -705,27 +1349,29 @@ def get_pool_receipts():
     """Get all receipts in the pool"""
     try:
         pool_folder = BASE_DIR / 'statements' / 'pool'
-        
-        if not pool_folder.exists():
-            return jsonify([])
-        
+
+        rel_folder = str(pool_folder.relative_to(BASE_DIR))
         receipts = []
-        for file_path in pool_folder.glob('*'):
-            if file_path.is_file() and not file_path.name.startswith('.'):
-                stat = file_path.stat()
-                receipts.append({
-                    'name': file_path.name,
-                    'path': str(file_path.relative_to(BASE_DIR)),
-                    'size': stat.st_size,
-                    'modified': stat.st_mtime
-                })
+        try:
+            with os.scandir(pool_folder) as it:
+                entries = [e for e in it if e.is_file() and not e.name.startswith('.')]
+        except OSError:
+            return jsonify([])
+
+        for entry in entries:
+            stat = entry.stat()
+            receipts.append({
+                'name': entry.name,
+                'path': f"{rel_folder}/{entry.name}",
+                'size': stat.st_size,
+                'modified': stat.st_mtime
+            })
         
         # Sort by modification time, newest first
         receipts.sort(key=lambda x: x['modified'], reverse=True)
         
         return jsonify(receipts)
     except Exception as e:
-        import traceback
         traceback.print_exc()
         return jsonify({'error': str(e)}), 500
 
@@ -769,9 +1415,8 @@ def assign_from_pool():
         statement_file = BASE_DIR / 'statements' / statement / f'{statement}.csv'
         output_csv = BASE_DIR / 'statements' / statement / f'{statement}_matches.csv'
         
-        # Load the CSV
-        csv_file = output_csv if output_csv.exists() else statement_file
-        df = pd.read_csv(csv_file, sep=';', encoding='utf-8-sig')
+        # Load through the cached loader
+        df = load_statement_data(f'{statement}.csv')
         
         # Update the transaction
         df.loc[row_index, 'Matching Receipt Found'] = True
@@ -785,13 +1430,13 @@ def assign_from_pool():
         df.loc[row_index, 'Manually_Unmatched'] = False
         
         # Save CSV
-        df.to_csv(output_csv, sep=';', index=False, encoding='utf-8-sig')
+        _save_matches(df, output_csv)
         
         # Move receipt to matched folder
         matched_folder = BASE_DIR / 'statements' / statement / 'matched_receipts'
         matched_folder.mkdir(parents=True, exist_ok=True)
         matched_destination = matched_folder / destination.name
-        shutil.move(str(destination), str(matched_destination))
+        _fast_move(destination, matched_destination)
         
         return jsonify({
             'success': True,
@@ -799,7 +1444,6 @@ def assign_from_pool():
         })
         
     except Exception as e:
-        import traceback
         traceback.print_exc()
         return jsonify({'error': str(e)}), 500
 
@@ -836,7 +1480,7 @@ def delete_receipt():
                 destination = pool_folder / new_filename
                 counter += 1
             
-            shutil.move(str(file_path), str(destination))
+            _fast_move(file_path, destination)
             return jsonify({
                 'success': True,
                 'message': f'Moved "{filename}" to pool',
@@ -852,7 +1496,6 @@ def delete_receipt():
             })
             
     except Exception as e:
-        import traceback
         traceback.print_exc()
         return jsonify({'error': str(e)}), 500
 
@@ -878,12 +1521,11 @@ def clear_statement():
         
         # Move all matched receipts back to receipts folder
         moved_count = 0
-        if matched_folder.exists():
-            for receipt_file in matched_folder.glob("*.pdf"):
-                # Move back to receipts folder
-                dest = receipts_folder / receipt_file.name
-                shutil.move(str(receipt_file), str(dest))
-                moved_count += 1
+        for entry in _list_pdfs(matched_folder):
+            # Move back to receipts folder
+            dest = receipts_folder / entry.name
+            _fast_move(entry.path, dest)
+            moved_count += 1
         
         # Delete the _matches.csv file
         output_csv = statement_folder / f"{statement_name.rsplit('.', 1)[0]}_matches.csv"
@@ -897,7 +1539,6 @@ def clear_statement():
         })
         
     except Exception as e:
-        import traceback
         traceback.print_exc()
         return jsonify({'error': str(e)}), 500
 
@@ -937,16 +1578,7 @@ def assign_receipt():
         statement_file = statement_folder / statement_name
         output_csv = statement_folder / f"{statement_name.rsplit('.', 1)[0]}_matches.csv"
         
-        if output_csv.exists():
-            df = pd.read_csv(output_csv, sep=';', encoding='utf-8-sig', dtype={'Matched Receipt File': str})
-        else:
-            df = pd.read_csv(statement_file, sep=';', encoding='utf-8-sig')
-            if 'Matching Receipt Found' not in df.columns:
-                df['Matching Receipt Found'] = False
-                df['Matched Receipt File'] = ''
-                df['Match Confidence'] = 0
-            if 'No Receipt Needed' not in df.columns:
-                df['No Receipt Needed'] = False
+        df = load_statement_data(statement_name)
         
         # Convert row number to dataframe index (row - 2 because of header and 0-index)
         df_index = row_number - 2
@@ -955,7 +1587,7 @@ def assign_receipt():
             return jsonify({'error': 'Invalid row index'}), 400
         
         # Check if row already has a receipt
-        existing_receipt = str(df.loc[df_index, 'Matched Receipt File']) if pd.notna(df.loc[df_index, 'Matched Receipt File']) else ''
+        existing_receipt = str(df.at[df_index, 'Matched Receipt File']) if pd.notna(df.at[df_index, 'Matched Receipt File']) else ''
         existing_receipt = existing_receipt if existing_receipt != 'nan' else ''
         
         # Handle existing receipt based on action
@@ -964,7 +1596,7 @@ def assign_receipt():
             existing_path = matched_folder / existing_receipt
             if existing_path.exists():
                 restore_path = receipts_folder / existing_receipt
-                shutil.move(str(existing_path), str(restore_path))
+                _fast_move(existing_path, restore_path)
         elif existing_receipt:
             # Delete existing receipt (replace action)
             existing_path = matched_folder / existing_receipt
@@ -972,14 +1604,13 @@ def assign_receipt():
                 existing_path.unlink()
         
         # Get transaction description for filename
-        import re
-        description = str(df.loc[df_index, 'Verwendungszweck'])
+        description = str(df.at[df_index, 'Verwendungszweck'])
         
         # Extract merchant name from description
         merchant = description.split('/')[0] if '/' in description else description.split(',')[0]
         merchant = merchant.strip()[:50]
-        merchant = re.sub(r'[^\w\s-]', '', merchant).strip()
-        merchant = re.sub(r'\s+', '_', merchant)
+        merchant = _FN_SANITIZE.sub('', merchant).strip()
+        merchant = _FN_WS.sub('_', merchant)
         
         # Create new filename
         file_ext = Path(file.filename).suffix
@@ -990,30 +1621,27 @@ def assign_receipt():
         file.save(str(new_path))
         
         # Update dataframe
-        df.loc[df_index, 'Matching Receipt Found'] = True
-        df.loc[df_index, 'Matched Receipt File'] = new_filename
-        df.loc[df_index, 'Match Confidence'] = 100  # Manual assignment = 100% confidence
-        df.loc[df_index, 'No Receipt Needed'] = False  # Clear "no receipt needed" flag
+        df.at[df_index, 'Matching Receipt Found'] = True
+        df.at[df_index, 'Matched Receipt File'] = new_filename
+        df.at[df_index, 'Match Confidence'] = 100  # Manual assignment = 100% confidence
+        df.at[df_index, 'No Receipt Needed'] = False  # Clear "no receipt needed" flag
         
         # Clear manually unmatched flag since user is now assigning a receipt
         if 'Manually_Unmatched' not in df.columns:
             df['Manually_Unmatched'] = False
-        df.loc[df_index, 'Manually_Unmatched'] = False
+        df.at[df_index, 'Manually_Unmatched'] = False
         
         # Reset ownership buttons to off when receipt is assigned
         if 'Owner_Mark' in df.columns:
-            df.loc[df_index, 'Owner_Mark'] = False
+            df.at[df_index, 'Owner_Mark'] = False
         if 'Owner_Flo' in df.columns:
-            df.loc[df_index, 'Owner_Flo'] = False
+            df.at[df_index, 'Owner_Flo'] = False
         
         # Save updated CSV
-        df.to_csv(output_csv, sep=';', index=False, encoding='utf-8-sig')
-        
-        # Add to undo history
-        if statement_name not in undo_history:
-            undo_history[statement_name] = deque(maxlen=50)
+        _save_matches(df, output_csv)
         
-        undo_history[statement_name].append({
+        # Add to undo history (cached deque plus persistent log)
+        history = _append_undo(statement_name, {
             'type': 'assign',
             'row': row_number,
             'new_file': new_filename,
@@ -1029,11 +1657,10 @@ def assign_receipt():
             'action': action,
             'existing_removed': existing_receipt,
             'message': f'Receipt assigned to row {row_number}',
-            'undo_available': len(undo_history[statement_name]) > 0
+            'undo_available': len(history) > 0
         })
         
     except Exception as e:
-        import traceback
         traceback.print_exc()
         return jsonify({'error': str(e)}), 500
 
@@ -1049,11 +1676,13 @@ def undo_last_action():
             return jsonify({'error': 'No statement specified'}), 400
         
         # Check if there's any history for this statement
-        if statement_name not in undo_history or len(undo_history[statement_name]) == 0:
+        history = _get_undo_history(statement_name)
+        if len(history) == 0:
             return jsonify({'error': 'Nothing to undo'}), 400
         
-        # Pop the last action
-        last_action = undo_history[statement_name].pop()
+        # Pop the last action and sync the persistent log
+        last_action = history.pop()
+        _rewrite_undo_log(statement_name, history)
         
         # Get folders
         statement_folder = get_statement_folder(statement_name)
@@ -1067,7 +1696,7 @@ def undo_last_action():
         if not output_csv.exists():
             return jsonify({'error': 'No matches file found'}), 400
         
-        df = pd.read_csv(output_csv, sep=';', encoding='utf-8-sig', dtype={'Matched Receipt File': str})
+        df = load_statement_data(statement_name)
         
         # Convert row number to dataframe index
         row_number = last_action['row']
@@ -1087,7 +1716,7 @@ def undo_last_action():
             if new_path.exists():
                 # Move back to receipts folder instead of deleting
                 restore_path = receipts_folder / new_file
-                shutil.move(str(new_path), str(restore_path))
+                _fast_move(new_path, restore_path)
             
             # Restore the old file if it was moved (restore action)
             if old_file and action == 'restore':
@@ -1095,37 +1724,36 @@ def undo_last_action():
                 old_receipts_path = receipts_folder / old_file
                 old_matched_path = matched_folder / old_file
                 if old_receipts_path.exists():
-                    shutil.move(str(old_receipts_path), str(old_matched_path))
+                    _fast_move(old_receipts_path, old_matched_path)
                     # Update CSV to reflect old file
-                    df.loc[df_index, 'Matching Receipt Found'] = True
-                    df.loc[df_index, 'Matched Receipt File'] = old_file
-                    df.loc[df_index, 'Match Confidence'] = 100
+                    df.at[df_index, 'Matching Receipt Found'] = True
+                    df.at[df_index, 'Matched Receipt File'] = old_file
+                    df.at[df_index, 'Match Confidence'] = 100
                 else:
                     # Old file not found, just clear the match
-                    df.loc[df_index, 'Matching Receipt Found'] = False
-                    df.loc[df_index, 'Matched Receipt File'] = ''
-                    df.loc[df_index, 'Match Confidence'] = 0
+                    df.at[df_index, 'Matching Receipt Found'] = False
+                    df.at[df_index, 'Matched Receipt File'] = ''
+                    df.at[df_index, 'Match Confidence'] = 0
             else:
                 # No old file or it was deleted (replace action)
                 # Just clear the match
-                df.loc[df_index, 'Matching Receipt Found'] = False
-                df.loc[df_index, 'Matched Receipt File'] = ''
-                df.loc[df_index, 'Match Confidence'] = 0
+                df.at[df_index, 'Matching Receipt Found'] = False
+                df.at[df_index, 'Matched Receipt File'] = ''
+                df.at[df_index, 'Match Confidence'] = 0
             
             # Save updated CSV
-            df.to_csv(output_csv, sep=';', index=False, encoding='utf-8-sig')
+            _save_matches(df, output_csv)
             
             return jsonify({
                 'success': True,
                 'message': f'Undid assignment for row {row_number}',
                 'row': row_number,
-                'undo_available': len(undo_history[statement_name]) > 0
+                'undo_available': len(history) > 0
             })
         
         return jsonify({'error': 'Unknown action type'}), 400
         
     except Exception as e:
-        import traceback
         traceback.print_exc()
         return jsonify({'error': str(e)}), 500
 
@@ -1157,46 +1785,57 @@ def set_ownership():
         statement_file = statement_folder / statement_name
         output_csv = statement_folder / f"{statement_name.rsplit('.', 1)[0]}_matches.csv"
         
-        # Load or create matches CSV
-        if output_csv.exists():
-            df = pd.read_csv(output_csv, sep=';', encoding='utf-8-sig', dtype={'Matched Receipt File': str})
-        else:
-            df = pd.read_csv(statement_file, sep=';', encoding='utf-8-sig')
-            if 'Matching Receipt Found' not in df.columns:
-                df['Matching Receipt Found'] = False
-                df['Matched Receipt File'] = ''
-                df['Match Confidence'] = 0
-            if 'No Receipt Needed' not in df.columns:
-                df['No Receipt Needed'] = False
-        
-        # Add owner columns if they don't exist
-        if 'Owner_Mark' not in df.columns:
-            df['Owner_Mark'] = False
-        if 'Owner_Flo' not in df.columns:
-            df['Owner_Flo'] = False
-        
+        # Bounds check against the cached load; the merged frame also
+        # supplies the other owner's current state for the auto-check below
+        df = load_statement_data(statement_name)
+
         # Convert row number to dataframe index
         df_index = row_number - 2
-        
+
         if df_index < 0 or df_index >= len(df):
             return jsonify({'error': 'Invalid row index'}), 400
-        
-        # Update ownership
+
+        active = bool(active)
+        mark_active = (bool(df.at[df_index, 'Owner_Mark'])
+                       if 'Owner_Mark' in df.columns else False)
+        flo_active = (bool(df.at[df_index, 'Owner_Flo'])
+                      if 'Owner_Flo' in df.columns else False)
+        no_receipt = (bool(df.at[df_index, 'No Receipt Needed'])
+                      if 'No Receipt Needed' in df.columns else False)
+
+        current = mark_active if owner == 'mark' else flo_active
         if owner == 'mark':
-            df.loc[df_index, 'Owner_Mark'] = active
-        elif owner == 'flo':
-            df.loc[df_index, 'Owner_Flo'] = active
-        
+            mark_active = active
+        else:
+            flo_active = active
+
+        # Repeated clicks often request the state the row already has -
+        # answer those from the cached frame without touching disk at
+        # all. The toggle is a no-op when the owner flag is unchanged
+        # and the auto-activation below would not flip No Receipt Needed
+        if current == active and (no_receipt or not (mark_active or flo_active)):
+            return jsonify({
+                'success': True,
+                'row': row_number,
+                'owner': owner,
+                'active': active
+            })
+
+        # An ownership click touches at most two flag cells, so record it
+        # in the overrides sidecar instead of rewriting the matches CSV;
+        # the next full save flushes it into the canonical files
+        overrides_path = _overrides_path(output_csv)
+        overrides = _load_overrides(overrides_path)
+        entry = overrides.setdefault(df_index, {})
+        entry['owner_mark' if owner == 'mark' else 'owner_flo'] = active
+
         # Auto-activate "No Receipt Needed" when either Mark or Flo is active
-        mark_active = bool(df.loc[df_index, 'Owner_Mark'])
-        flo_active = bool(df.loc[df_index, 'Owner_Flo'])
-        
         if mark_active or flo_active:
-            df.loc[df_index, 'No Receipt Needed'] = True
+            entry['no_receipt_needed'] = True
         # When both are deactivated, keep "No Receipt Needed" (persistent behavior)
-        
-        # Save updated CSV
-        df.to_csv(output_csv, sep=';', index=False, encoding='utf-8-sig')
+
+        statement_folder.mkdir(parents=True, exist_ok=True)
+        _save_overrides(overrides_path, overrides)
         
         return jsonify({
             'success': True,
@@ -1206,7 +1845,6 @@ def set_ownership():
         })
         
     except Exception as e:
-        import traceback
         traceback.print_exc()
         return jsonify({'error': str(e)}), 500
 
@@ -1240,7 +1878,7 @@ def delete_receipt_assignment():
         if not output_csv.exists():
             return jsonify({'error': 'No matches file found'}), 400
         
-        df = pd.read_csv(output_csv, sep=';', encoding='utf-8-sig', dtype={'Matched Receipt File': str})
+        df = load_statement_data(statement_name)
         
         # Convert row number to dataframe index
         df_index = row_number - 2
@@ -1249,8 +1887,6 @@ def delete_receipt_assignment():
             return jsonify({'error': 'Invalid row index'}), 400
         
         # Move file back to receipts folder with random prefix
-        import random
-        import string
         
         matched_file_path = matched_folder / filename
         if matched_file_path.exists():
@@ -1260,26 +1896,26 @@ def delete_receipt_assignment():
             new_path = receipts_folder / new_filename
             
             # Move file
-            shutil.move(str(matched_file_path), str(new_path))
+            _fast_move(matched_file_path, new_path)
         else:
             return jsonify({'error': 'Receipt file not found'}), 404
         
         # Clear match in CSV and mark as manually unmatched
-        df.loc[df_index, 'Matching Receipt Found'] = False
-        df.loc[df_index, 'Matched Receipt File'] = ''
-        df.loc[df_index, 'Match Confidence'] = 0
+        df.at[df_index, 'Matching Receipt Found'] = False
+        df.at[df_index, 'Matched Receipt File'] = ''
+        df.at[df_index, 'Match Confidence'] = 0
         
         # Add Manually_Unmatched column if it doesn't exist
         if 'Manually_Unmatched' not in df.columns:
             df['Manually_Unmatched'] = False
         
         # Mark as manually unmatched to prevent automatic re-matching
-        df.loc[df_index, 'Manually_Unmatched'] = True
+        df.at[df_index, 'Manually_Unmatched'] = True
         
         # Note: We keep "No Receipt Needed" and ownership settings as they were
         
         # Save updated CSV
-        df.to_csv(output_csv, sep=';', index=False, encoding='utf-8-sig')
+        _save_matches(df, output_csv)
         
         return jsonify({
             'success': True,
@@ -1290,7 +1926,6 @@ def delete_receipt_assignment():
         })
         
     except Exception as e:
-        import traceback
         traceback.print_exc()
         return jsonify({'error': str(e)}), 500
 
@@ -1304,9 +1939,7 @@ def get_undo_history():
         if not statement_name:
             return jsonify({'error': 'No statement specified'}), 400
         
-        history = []
-        if statement_name in undo_history:
-            history = list(undo_history[statement_name])
+        history = list(_get_undo_history(statement_name))
         
         return jsonify({
             'history': history,
@@ -1341,78 +1974,101 @@ def update_learning():
         if not output_csv.exists():
             return jsonify({'error': 'No matches file found'}), 400
         
-        df = pd.read_csv(output_csv, sep=';', encoding='utf-8-sig', dtype={'Matched Receipt File': str})
+        df = load_statement_data(statement_name)
         
-        # Get all matched receipts
+        # Get all matched receipts - column presence checked once and one
+        # vectorized mask, instead of per-row .get/notna lookups
         matched_receipts = []
-        for idx, row in df.iterrows():
-            if row.get('Matching Receipt Found', False):
-                receipt_file = str(row.get('Matched Receipt File', ''))
-                if receipt_file and receipt_file != 'nan' and receipt_file != '':
-                    matched_receipts.append({
-                        'file': receipt_file,
-                        'date': row['Buchungstag'],
-                        'amount': row['Betrag'],
-                        'description': row['Verwendungszweck']
-                    })
+        if 'Matching Receipt Found' in df.columns and 'Matched Receipt File' in df.columns:
+            files = df['Matched Receipt File'].fillna('').astype(str)
+            mask = (df['Matching Receipt Found'].fillna(False).astype(bool)
+                    & files.ne('') & files.ne('nan')).values
+            sub = df[mask]
+            matched_receipts = [
+                {'file': f, 'date': d, 'amount': a, 'description': desc}
+                for f, d, a, desc in zip(
+                    files.values[mask].tolist(),
+                    sub['Buchungstag'].tolist(),
+                    sub['Betrag'].tolist(),
+                    sub['Verwendungszweck'].tolist())
+            ]
         
         if len(matched_receipts) == 0:
             return jsonify({'error': 'No matched receipts to learn from'}), 400
         
-        # Process each matched receipt to extract features for learning
+        # Process each matched receipt to extract features for learning.
+        # The per-PDF extractions are independent, so fan them out over a
+        # thread pool: pytesseract shells out to the tesseract binary, so
+        # the expensive OCR calls overlap instead of queueing on one core
         from src.receipt_processor import ReceiptProcessor
-        
+
         processor = ReceiptProcessor(str(matched_folder))
-        learning_data = []
-        
-        for receipt in matched_receipts:
+
+        def _extract(receipt):
             receipt_path = matched_folder / receipt['file']
-            if receipt_path.exists():
-                try:
-                    # Extract receipt data
-                    receipt_data = processor.process_receipt(receipt_path)
-                    
-                    # Store the match for learning
-                    learning_data.append({
-                        'receipt_file': receipt['file'],
-                        'receipt_amount': receipt_data.get('amount'),
-                        'receipt_date': receipt_data.get('date'),
-                        'receipt_merchant': receipt_data.get('merchant'),
-                        'transaction_amount': receipt['amount'],
-                        'transaction_date': receipt['date'],
-                        'transaction_description': receipt['description']
-                    })
-                except Exception as e:
-                    print(f"Error processing {receipt['file']}: {e}")
-                    continue
-        
-        # Save learning data to a training file
-        learning_file = statement_folder / 'learning_data.json'
-        import json
-        
-        # Load existing learning data if it exists
-        if learning_file.exists():
-            with open(learning_file, 'r', encoding='utf-8') as f:
-                existing_data = json.load(f)
-        else:
-            existing_data = []
-        
-        # Append new learning data
-        existing_data.extend(learning_data)
-        
-        # Save updated learning data
-        with open(learning_file, 'w', encoding='utf-8') as f:
-            json.dump(existing_data, f, indent=2, ensure_ascii=False, default=str)
+            if not receipt_path.exists():
+                return None
+            try:
+                receipt_data = processor.process_receipt(receipt_path)
+            except Exception as e:
+                print(f"Error processing {receipt['file']}: {e}")
+                return None
+
+            # Store the match for learning
+            return {
+                'receipt_file': receipt['file'],
+                'receipt_amount': receipt_data.get('amount'),
+                'receipt_date': receipt_data.get('date'),
+                'receipt_merchant': receipt_data.get('merchant'),
+                'transaction_amount': receipt['amount'],
+                'transaction_date': receipt['date'],
+                'transaction_description': receipt['description']
+            }
+
+        workers = min(len(matched_receipts), os.cpu_count() or 4)
+        with ThreadPoolExecutor(max_workers=workers) as pool:
+            learning_data = [entry for entry in pool.map(_extract, matched_receipts)
+                             if entry is not None]
+        
+        # Save learning data to a training file. JSON Lines: each run
+        # appends O(new samples) instead of loading and rewriting the
+        # whole accumulated history
+        learning_file = statement_folder / 'learning_data.jsonl'
+        legacy_file = statement_folder / 'learning_data.json'
+
+        def _jsonl_line(item):
+            if orjson is not None:
+                return orjson.dumps(item, default=str) + b'\n'
+            return (json.dumps(item, ensure_ascii=False, default=str)
+                    + '\n').encode('utf-8')
+
+        # One-time migration of the old whole-file format
+        if legacy_file.exists() and not learning_file.exists():
+            try:
+                with open(legacy_file, 'rb') as f:
+                    legacy = (orjson.loads(f.read()) if orjson is not None
+                              else json.load(f))
+                with open(learning_file, 'wb') as f:
+                    f.writelines(_jsonl_line(item) for item in legacy)
+                legacy_file.unlink()
+            except Exception as e:
+                logger.warning(f"Could not migrate {legacy_file.name}: {e}")
+
+        with open(learning_file, 'ab') as f:
+            f.writelines(_jsonl_line(item) for item in learning_data)
+
+        # Line count is the sample count - a raw byte scan, no JSON parse
+        with open(learning_file, 'rb') as f:
+            total_samples = sum(1 for _ in f)
         
         return jsonify({
             'success': True,
             'receipts_processed': len(learning_data),
-            'total_learning_samples': len(existing_data),
+            'total_learning_samples': total_samples,
             'message': f'Learning model updated with {len(learning_data)} receipts'
         })
         
     except Exception as e:
-        import traceback
         traceback.print_exc()
         return jsonify({'error': str(e)}), 500
 
@@ -1438,8 +2094,8 @@ def delete_statement():
             return jsonify({'error': 'Statement not found'}), 404
         
         # Count items before deletion for reporting
-        receipts_count = len(list(statement_folder.glob("receipts/*.pdf")))
-        matched_count = len(list(statement_folder.glob("matched_receipts/*.pdf")))
+        receipts_count = len(_list_pdfs(statement_folder / 'receipts'))
+        matched_count = len(_list_pdfs(statement_folder / 'matched_receipts'))
         
         # Delete the entire statement folder
         shutil.rmtree(statement_folder)
@@ -1452,7 +2108,6 @@ def delete_statement():
         })
         
     except Exception as e:
-        import traceback
         traceback.print_exc()
         return jsonify({'error': str(e)}), 500
 
@@ -1476,23 +2131,10 @@ def open_folder():
         if not os.path.exists(folder_path):
             return jsonify({'error': f'Folder does not exist: {folder_path}'}), 404
         
-        # Open folder based on OS
-        import platform
-        import subprocess
-        
-        system = platform.system()
+        # Open folder with the launcher resolved at import time;
+        # close_fds keeps the server's sockets out of the child
         try:
-            if system == 'Darwin':  # macOS
-                subprocess.Popen(['open', folder_path])
-            elif system == 'Windows':
-                subprocess.Popen(['explorer', folder_path])
-            else:  # Linux
-                # Check if xdg-open exists
-                try:
-                    subprocess.Popen(['xdg-open', folder_path])
-                except FileNotFoundError:
-                    return jsonify({'error': 'Cannot open folders on this system (server environment)'}), 400
-            
+            subprocess.Popen([_OPEN_FOLDER_CMD, folder_path], close_fds=True)
             return jsonify({'success': True, 'message': f'Opened folder: {os.path.basename(folder_path)}'})
         except FileNotFoundError as e:
             return jsonify({'error': f'Cannot open folders on this system: {str(e)}'}), 400
@@ -1506,8 +2148,9 @@ def get_learned_urls():
     try:
         urls_file = os.path.join(os.path.dirname(__file__), '..', 'data', 'learned_urls.json')
         if os.path.exists(urls_file):
-            with open(urls_file, 'r') as f:
-                return jsonify(json.load(f))
+            with open(urls_file, 'rb') as f:
+                return _json_response(orjson.loads(f.read()) if orjson is not None
+                                      else json.load(f))
         return jsonify({})
     except Exception as e:
         return jsonify({'error': str(e)}), 500
@@ -1532,4 +2175,7 @@ def save_learned_urls():
 
 
 if __name__ == '__main__':
-    app.run(debug=True, host='0.0.0.0', port=5001)
+    # Production runs under gunicorn (see startup.sh); this entrypoint is
+    # for local development, so only enable the debugger when asked
+    app.run(debug=os.environ.get('FLASK_ENV', 'development') == 'development',
+            host='0.0.0.0', port=5001)
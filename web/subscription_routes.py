@@ -6,11 +6,105 @@ from src.stripe_client import stripe_client
 from src.supabase_client import supabase_client
 from src.auth_middleware import get_current_user, get_current_user_id, login_required
 import os
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 
+from src.utils.logging import setup_logger
+
+logger = setup_logger(__name__)
+
 # Create blueprint
 subscription_bp = Blueprint('subscription', __name__, url_prefix='/subscribe')
 
+# Stripe config is fixed for the process lifetime - read it once instead
+# of hitting os.environ on every checkout request
+_STRIPE_PRICE_ID = os.getenv('STRIPE_PRICE_ID')
+_STRIPE_PUBLISHABLE_KEY = os.getenv('STRIPE_PUBLISHABLE_KEY')
+
+# Subscription rows change rarely but are read by every billing page and
+# by the /api/status poll, so cache them briefly per user. Local writes
+# and webhooks invalidate eagerly; the TTL bounds staleness for writes
+# that land in another worker process.
+_SUB_CACHE_TTL = 30.0  # seconds
+# Users without a subscription row are the common case and only gain a
+# row through this app's own checkout flow (which invalidates), so the
+# no-row answer can live much longer
+_SUB_CACHE_NEGATIVE_TTL = 300.0  # seconds
+_sub_cache = {}             # {user_id: (expiry, row-or-None)}
+_customer_to_user = {}      # {stripe_customer_id: user_id}
+_subscription_to_user = {}  # {stripe_subscription_id: user_id}
+_sub_cache_lock = threading.Lock()
+
+# Webhook work happens off the request thread: Stripe only needs a fast
+# 2xx once the signature checks out, and slow Supabase writes inside the
+# request cycle risk timeouts and retry storms
+_webhook_executor = ThreadPoolExecutor(max_workers=4,
+                                       thread_name_prefix='stripe-webhook')
+
+# External URLs handed to Stripe, memoized per (scheme, host): building
+# them runs the routing adapter every time, and they only change when
+# the serving host does
+_external_urls = {}
+
+
+def _external_url(endpoint):
+    """url_for(..., _external=True) cached per request host"""
+    key = (request.scheme, request.host, endpoint)
+    url = _external_urls.get(key)
+    if url is None:
+        url = url_for(endpoint, _external=True)
+        _external_urls[key] = url
+    return url
+
+
+def _ts(unix_ts):
+    """Unix timestamp from Stripe -> ISO string for timestamptz columns"""
+    return datetime.fromtimestamp(unix_ts).isoformat() if unix_ts else None
+
+
+def get_cached_subscription(user_id):
+    """Return the user's subscription row (or None) with a short TTL cache
+
+    Missing rows are cached too - the checkout page polls just as often
+    for users without a subscription. Callers get a copy, so mutating
+    the returned dict never pollutes the cache.
+    """
+    now = time.monotonic()
+    with _sub_cache_lock:
+        cached = _sub_cache.get(user_id)
+        if cached is not None and cached[0] > now:
+            row = cached[1]
+            return dict(row) if row is not None else None
+
+    result = supabase_client.select('subscriptions', {'user_id': user_id})
+    row = result['data'][0] if result['success'] and result['data'] else None
+
+    ttl = _SUB_CACHE_TTL if row is not None else _SUB_CACHE_NEGATIVE_TTL
+    with _sub_cache_lock:
+        _sub_cache[user_id] = (now + ttl, row)
+        if row is not None:
+            # Reverse indexes let webhooks (which only know Stripe ids)
+            # find the cache entry to drop
+            if row.get('stripe_customer_id'):
+                _customer_to_user[row['stripe_customer_id']] = user_id
+            if row.get('stripe_subscription_id'):
+                _subscription_to_user[row['stripe_subscription_id']] = user_id
+    return dict(row) if row is not None else None
+
+
+def invalidate_subscription_cache(user_id=None, customer_id=None,
+                                  subscription_id=None):
+    """Drop a cached subscription row after a write"""
+    with _sub_cache_lock:
+        if user_id is None and customer_id is not None:
+            user_id = _customer_to_user.get(customer_id)
+        if user_id is None and subscription_id is not None:
+            user_id = _subscription_to_user.get(subscription_id)
+        if user_id is not None:
+            _sub_cache.pop(user_id, None)
+
 
 @subscription_bp.route('/checkout')
 @login_required
@@ -21,11 +115,9 @@ def checkout():
     user_email = user.get('email')
     
     # Check if user already has a subscription
-    existing_sub = supabase_client.select('subscriptions', {'user_id': user_id})
+    subscription = get_cached_subscription(user_id)
     
-    if existing_sub['success'] and existing_sub['data']:
-        subscription = existing_sub['data'][0]
-        
+    if subscription:
         # If already active or trialing, redirect to manage page
         if subscription['status'] in ['active', 'trialing']:
             flash('You already have an active subscription', 'info')
@@ -33,7 +125,7 @@ def checkout():
     
     return render_template('subscription/checkout.html', 
                          user_email=user_email,
-                         stripe_publishable_key=os.getenv('STRIPE_PUBLISHABLE_KEY'))
+                         stripe_publishable_key=_STRIPE_PUBLISHABLE_KEY)
 
 
 @subscription_bp.route('/create-checkout-session', methods=['POST'])
@@ -46,10 +138,10 @@ def create_checkout_session():
     
     try:
         # Check if user has a Stripe customer ID
-        subscription_data = supabase_client.select('subscriptions', {'user_id': user_id})
+        subscription = get_cached_subscription(user_id)
         
-        if subscription_data['success'] and subscription_data['data']:
-            customer_id = subscription_data['data'][0]['stripe_customer_id']
+        if subscription:
+            customer_id = subscription['stripe_customer_id']
         else:
             # Create Stripe customer
             customer_result = stripe_client.create_customer(
@@ -62,17 +154,20 @@ def create_checkout_session():
             
             customer_id = customer_result['customer'].id
             
-            # Save customer ID to database
-            supabase_client.insert('subscriptions', {
+            # Save customer ID to database. Upsert on user_id so a
+            # racing double-submit of the checkout form merges into the
+            # existing row instead of failing the unique constraint
+            supabase_client.upsert('subscriptions', {
                 'user_id': user_id,
                 'stripe_customer_id': customer_id,
                 'status': 'incomplete',
-                'stripe_price_id': os.getenv('STRIPE_PRICE_ID')
-            })
+                'stripe_price_id': _STRIPE_PRICE_ID
+            }, on_conflict='user_id')
+            invalidate_subscription_cache(user_id=user_id)
         
         # Create checkout session
-        success_url = url_for('subscription.success', _external=True) + '?session_id={CHECKOUT_SESSION_ID}'
-        cancel_url = url_for('subscription.checkout', _external=True)
+        success_url = _external_url('subscription.success') + '?session_id={CHECKOUT_SESSION_ID}'
+        cancel_url = _external_url('subscription.checkout')
         
         session_result = stripe_client.create_checkout_session(
             customer_id=customer_id,
@@ -117,14 +212,12 @@ def manage():
     user_id = get_current_user_id()
     
     # Get subscription from database
-    result = supabase_client.select('subscriptions', {'user_id': user_id})
+    subscription = get_cached_subscription(user_id)
     
-    if not result['success'] or not result['data']:
+    if not subscription:
         flash('No subscription found', 'error')
         return redirect(url_for('subscription.checkout'))
     
-    subscription = result['data'][0]
-    
     # Get latest from Stripe
     if subscription.get('stripe_subscription_id'):
         stripe_sub = stripe_client.get_subscription(subscription['stripe_subscription_id'])
@@ -133,16 +226,24 @@ def manage():
             # Update local database with latest info
             stripe_subscription = stripe_sub['subscription']
             
-            supabase_client.update('subscriptions', {
+            updated_fields = {
                 'status': stripe_subscription.status,
-                'current_period_start': datetime.fromtimestamp(stripe_subscription.current_period_start).isoformat(),
-                'current_period_end': datetime.fromtimestamp(stripe_subscription.current_period_end).isoformat(),
+                'current_period_start': _ts(stripe_subscription.current_period_start),
+                'current_period_end': _ts(stripe_subscription.current_period_end),
                 'cancel_at_period_end': stripe_subscription.cancel_at_period_end
-            }, {'user_id': user_id})
+            }
+            update_result = supabase_client.update(
+                'subscriptions', updated_fields, {'user_id': user_id})
+            invalidate_subscription_cache(user_id=user_id)
             
-            # Refresh subscription data
-            result = supabase_client.select('subscriptions', {'user_id': user_id})
-            subscription = result['data'][0] if result['success'] else subscription
+            # PostgREST returns the updated row inline (supabase-py sends
+            # Prefer: return=representation), so render straight from the
+            # update response - no refresh SELECT. Fall back to merging
+            # the fields we just wrote if the update failed.
+            if update_result['success'] and update_result['data']:
+                subscription = update_result['data'][0]
+            else:
+                subscription.update(updated_fields)
     
     return render_template('subscription/manage.html', subscription=subscription)
 
@@ -154,15 +255,15 @@ def create_portal_session():
     user_id = get_current_user_id()
     
     # Get customer ID
-    result = supabase_client.select('subscriptions', {'user_id': user_id})
+    subscription = get_cached_subscription(user_id)
     
-    if not result['success'] or not result['data']:
+    if not subscription:
         return jsonify({'error': 'No subscription found'}), 404
     
-    customer_id = result['data'][0]['stripe_customer_id']
+    customer_id = subscription['stripe_customer_id']
     
     # Create portal session
-    return_url = url_for('subscription.manage', _external=True)
+    return_url = _external_url('subscription.manage')
     portal_result = stripe_client.create_portal_session(customer_id, return_url)
     
     if portal_result['success']:
@@ -177,30 +278,35 @@ def subscription_status():
     """Get subscription status (API endpoint)."""
     user_id = get_current_user_id()
     
-    result = supabase_client.select('subscriptions', {'user_id': user_id})
+    subscription = get_cached_subscription(user_id)
     
-    if not result['success'] or not result['data']:
-        return jsonify({
+    if not subscription:
+        response = jsonify({
             'subscribed': False,
             'status': 'none'
         })
+    else:
+        response = jsonify({
+            'subscribed': subscription['status'] in ['active', 'trialing'],
+            'status': subscription['status'],
+            'trial_end': subscription.get('trial_end'),
+            'current_period_end': subscription.get('current_period_end'),
+            'cancel_at_period_end': subscription.get('cancel_at_period_end', False)
+        })
     
-    subscription = result['data'][0]
-    
-    return jsonify({
-        'subscribed': subscription['status'] in ['active', 'trialing'],
-        'status': subscription['status'],
-        'trial_end': subscription.get('trial_end'),
-        'current_period_end': subscription.get('current_period_end'),
-        'cancel_at_period_end': subscription.get('cancel_at_period_end', False)
-    })
+    # Let the browser reuse the answer for the poll interval so most
+    # dashboard polls never reach the server at all
+    response.headers['Cache-Control'] = 'private, max-age=30'
+    return response
 
 
 # Webhook endpoint (not protected by login)
 @subscription_bp.route('/webhook', methods=['POST'])
 def stripe_webhook():
     """Handle Stripe webhooks."""
-    payload = request.get_data()
+    # cache=False keeps the body out of the Request object after the
+    # HMAC check - nothing reads it again once the event is parsed
+    payload = request.get_data(cache=False)
     sig_header = request.headers.get('Stripe-Signature')
     
     # Verify webhook signature
@@ -210,44 +316,38 @@ def stripe_webhook():
         return jsonify({'error': event_result.get('error')}), 400
     
     event = event_result['event']
-    event_type = event['type']
-    
-    # Handle different event types
-    if event_type == 'checkout.session.completed':
-        handle_checkout_completed(event['data']['object'])
-    
-    elif event_type == 'customer.subscription.created':
-        handle_subscription_created(event['data']['object'])
-    
-    elif event_type == 'customer.subscription.updated':
-        handle_subscription_updated(event['data']['object'])
-    
-    elif event_type == 'customer.subscription.deleted':
-        handle_subscription_deleted(event['data']['object'])
-    
-    elif event_type == 'invoice.paid':
-        handle_invoice_paid(event['data']['object'])
-    
-    elif event_type == 'invoice.payment_failed':
-        handle_payment_failed(event['data']['object'])
     
-    return jsonify({'status': 'success'})
+    # Stripe delivers at least once: claim the event id before doing any
+    # work, so a re-delivery hits the primary key and is dropped here
+    dedup = supabase_client.insert('processed_events', {'event_id': event['id']})
+    if not dedup['success']:
+        error = str(dedup.get('error', ''))
+        if 'duplicate' in error.lower() or '23505' in error:
+            return jsonify({'status': 'duplicate'})
+        # Dedup table unreachable - dispatch anyway, the handlers are
+        # idempotent updates
+        logger.warning(f"Webhook dedup insert failed: {error}")
+    
+    # Signature is verified - acknowledge immediately and do the database
+    # work off-thread so Stripe never times out waiting on Supabase
+    _webhook_executor.submit(_process_stripe_event, event)
+    
+    return jsonify({'status': 'queued'})
 
 
-def handle_checkout_completed(session):
-    """Handle successful checkout session."""
-    customer_id = session.get('customer')
-    subscription_id = session.get('subscription')
+def _process_stripe_event(event):
+    """Dispatch a verified Stripe event to its handler (worker thread)"""
+    event_type = event['type']
     
-    # Find user by customer ID
-    result = supabase_client.select('subscriptions', {'stripe_customer_id': customer_id})
+    handler = _EVENT_HANDLERS.get(event_type)
+    if handler is None:
+        logger.debug(f"Ignoring unhandled Stripe event type: {event_type}")
+        return
     
-    if result['success'] and result['data']:
-        # Update subscription with subscription ID
-        supabase_client.update('subscriptions', {
-            'stripe_subscription_id': subscription_id,
-            'status': 'trialing'  # Will be updated by subscription.created event
-        }, {'stripe_customer_id': customer_id})
+    try:
+        handler(event['data']['object'])
+    except Exception as e:
+        logger.error(f"Stripe webhook {event_type} failed: {e}")
 
 
 def handle_subscription_created(subscription):
@@ -256,21 +356,15 @@ def handle_subscription_created(subscription):
     subscription_id = subscription.get('id')
     status = subscription.get('status')
     
-    current_period_start = datetime.fromtimestamp(subscription.get('current_period_start')).isoformat()
-    current_period_end = datetime.fromtimestamp(subscription.get('current_period_end')).isoformat()
-    
-    trial_end = None
-    if subscription.get('trial_end'):
-        trial_end = datetime.fromtimestamp(subscription.get('trial_end')).isoformat()
-    
     # Update subscription
     supabase_client.update('subscriptions', {
         'stripe_subscription_id': subscription_id,
         'status': status,
-        'current_period_start': current_period_start,
-        'current_period_end': current_period_end,
-        'trial_end': trial_end
+        'current_period_start': _ts(subscription.get('current_period_start')),
+        'current_period_end': _ts(subscription.get('current_period_end')),
+        'trial_end': _ts(subscription.get('trial_end'))
     }, {'stripe_customer_id': customer_id})
+    invalidate_subscription_cache(customer_id=customer_id)
 
 
 def handle_subscription_updated(subscription):
@@ -279,25 +373,23 @@ def handle_subscription_updated(subscription):
     status = subscription.get('status')
     cancel_at_period_end = subscription.get('cancel_at_period_end', False)
     
-    current_period_end = datetime.fromtimestamp(subscription.get('current_period_end')).isoformat()
-    
     # Update subscription
     supabase_client.update('subscriptions', {
         'status': status,
-        'current_period_end': current_period_end,
+        'current_period_end': _ts(subscription.get('current_period_end')),
         'cancel_at_period_end': cancel_at_period_end
     }, {'stripe_subscription_id': subscription_id})
+    invalidate_subscription_cache(subscription_id=subscription_id)
 
 
 def handle_subscription_deleted(subscription):
     """Handle subscription cancellation."""
     subscription_id = subscription.get('id')
     
-    # Update subscription status
-    supabase_client.update('subscriptions', {
-        'status': 'canceled',
-        'canceled_at': datetime.utcnow().isoformat()
-    }, {'stripe_subscription_id': subscription_id})
+    # Update subscription status; the RPC stamps canceled_at with the
+    # database clock, so the timestamp can't drift with the app server's
+    supabase_client.rpc('mark_subscription_canceled', {'sub_id': subscription_id})
+    invalidate_subscription_cache(subscription_id=subscription_id)
 
 
 def handle_invoice_paid(invoice):
@@ -309,6 +401,7 @@ def handle_invoice_paid(invoice):
         supabase_client.update('subscriptions', {
             'status': 'active'
         }, {'stripe_subscription_id': subscription_id})
+        invalidate_subscription_cache(subscription_id=subscription_id)
 
 
 def handle_payment_failed(invoice):
@@ -320,3 +413,18 @@ def handle_payment_failed(invoice):
         supabase_client.update('subscriptions', {
             'status': 'past_due'
         }, {'stripe_subscription_id': subscription_id})
+        invalidate_subscription_cache(subscription_id=subscription_id)
+
+
+# Event-type dispatch table for _process_stripe_event.
+# checkout.session.completed is deliberately absent: it arrives
+# alongside customer.subscription.created, whose payload is a superset
+# (subscription id, status, periods, trial) keyed on the same
+# stripe_customer_id - acting on both doubled the write traffic.
+_EVENT_HANDLERS = {
+    'customer.subscription.created': handle_subscription_created,
+    'customer.subscription.updated': handle_subscription_updated,
+    'customer.subscription.deleted': handle_subscription_deleted,
+    'invoice.paid': handle_invoice_paid,
+    'invoice.payment_failed': handle_payment_failed,
+}